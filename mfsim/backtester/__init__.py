@@ -1,6 +1,7 @@
 # mutual_fund_backtester/backtester/__init__.py
 
+from .grid import run_grid
 from .lot_tracker import Lot, LotTracker, RealizedGain
 from .simulator import Simulator
 
-__all__ = ["Simulator", "LotTracker", "Lot", "RealizedGain"]
+__all__ = ["Simulator", "LotTracker", "Lot", "RealizedGain", "run_grid"]
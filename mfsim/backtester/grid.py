@@ -0,0 +1,158 @@
+"""
+Parameter-grid sweeps over a strategy class.
+
+Each combination of strategy parameters is an independent backtest, so the
+grid is spread across worker processes. NAV data is fetched once in the
+parent and shipped to every worker when it starts, rather than being
+re-fetched (or re-pickled) for each combination.
+
+Example::
+
+    from mfsim.backtester import run_grid
+    from mfsim.strategies import MomentumValueStrategy
+
+    results = run_grid(
+        MomentumValueStrategy,
+        param_grid={"momentum_period": [90, 180, 365]},
+        strategy_kwargs={
+            "frequency": "semi-annually",
+            "metrics": ["Total Return", "XIRR"],
+            "value_fund": "Some Value Fund - Direct Plan",
+            "momentum_fund": "Some Momentum Fund - Direct Plan",
+        },
+        simulator_kwargs={
+            "start_date": "2020-01-01",
+            "end_date": "2025-01-01",
+            "initial_investment": 100000,
+            "sip_amount": 10000,
+        },
+    )
+    # One row per momentum_period, with a column per metric.
+"""
+
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from mfsim.backtester.simulator import Simulator
+from mfsim.utils.data_loader import BaseDataLoader, MfApiDataLoader
+
+
+class _PreloadedDataLoader(BaseDataLoader):
+    """Serves NAV frames and fund costs captured from another data loader."""
+
+    def __init__(self, nav_frames, expense_ratios, exit_loads):
+        # Deliberately skip super().__init__(): everything is already in memory.
+        self.nav_frames = nav_frames
+        self.expense_ratios = expense_ratios
+        self.exit_loads = exit_loads
+
+    def load_nav_data(self, fund_name) -> pd.DataFrame:
+        if fund_name not in self.nav_frames:
+            raise FileNotFoundError(f"NAV data for {fund_name} was not preloaded")
+        return self.nav_frames[fund_name].copy()
+
+    def get_expense_ratio(self, fund_name) -> float:
+        return self.expense_ratios.get(fund_name, 0)
+
+    def get_exit_load(self, fund_name) -> float:
+        return self.exit_loads.get(fund_name, 0)
+
+
+def _preload(data_loader, fund_names):
+    """Fetch every fund once from ``data_loader`` into a picklable loader."""
+    return _PreloadedDataLoader(
+        nav_frames={fund: data_loader.load_nav_data(fund) for fund in fund_names},
+        expense_ratios={fund: data_loader.get_expense_ratio(fund) for fund in fund_names},
+        exit_loads={fund: data_loader.get_exit_load(fund) for fund in fund_names},
+    )
+
+
+# Per-process state, populated by _init_worker in each pool worker.
+_worker_state = {}
+
+
+def _init_worker(strategy_cls, strategy_kwargs, simulator_kwargs, data_loader):
+    _worker_state.update(
+        strategy_cls=strategy_cls,
+        strategy_kwargs=strategy_kwargs,
+        simulator_kwargs=simulator_kwargs,
+        data_loader=data_loader,
+    )
+
+
+def _run_variant(params):
+    """Run one backtest for ``params`` using the state set by :func:`_init_worker`."""
+    strategy = _worker_state["strategy_cls"](**_worker_state["strategy_kwargs"], **params)
+    sim = Simulator(
+        strategy=strategy,
+        data_loader=_worker_state["data_loader"],
+        **_worker_state["simulator_kwargs"],
+    )
+    return {**params, **sim.run()}
+
+
+def run_grid(
+    strategy_cls,
+    param_grid,
+    simulator_kwargs,
+    strategy_kwargs=None,
+    data_loader=None,
+    max_workers=None,
+) -> pd.DataFrame:
+    """Backtest every combination of ``param_grid`` in parallel.
+
+    Args:
+        strategy_cls: A :class:`~mfsim.strategies.base_strategy.BaseStrategy`
+            subclass. Must be importable by worker processes (i.e. defined
+            at module level).
+        param_grid: Dict mapping strategy parameter names to lists of
+            values. Every combination (Cartesian product) is backtested.
+        simulator_kwargs: Keyword arguments passed to every
+            :class:`~mfsim.backtester.simulator.Simulator` (``start_date``,
+            ``end_date``, ``initial_investment``, ``sip_amount``, ...).
+            ``strategy`` and ``data_loader`` are supplied by this function.
+        strategy_kwargs: Keyword arguments shared by every strategy
+            instance, merged with each grid combination.
+        data_loader: Source of NAV data. Defaults to ``MfApiDataLoader``.
+            Each fund is loaded exactly once, in the calling process.
+        max_workers: Number of worker processes. ``None`` uses
+            ``os.cpu_count()``; ``1`` runs every combination in-process.
+
+    Returns:
+        DataFrame with one row per combination, in grid order: one column
+        per swept parameter followed by one column per computed metric.
+    """
+    strategy_kwargs = strategy_kwargs or {}
+    names = list(param_grid)
+    combos = [dict(zip(names, values)) for values in itertools.product(*param_grid.values())]
+    if not combos:
+        return pd.DataFrame(columns=names)
+
+    # Instantiate each variant up front to learn which funds must be loaded.
+    fund_names = set()
+    for params in combos:
+        fund_names.update(strategy_cls(**strategy_kwargs, **params).fund_list)
+    if simulator_kwargs.get("benchmark_fund"):
+        fund_names.add(simulator_kwargs["benchmark_fund"])
+
+    if data_loader is None:
+        data_loader = MfApiDataLoader()
+    preloaded = _preload(data_loader, sorted(fund_names))
+    init_args = (strategy_cls, strategy_kwargs, simulator_kwargs, preloaded)
+
+    if max_workers == 1:
+        _init_worker(*init_args)
+        try:
+            rows = [_run_variant(params) for params in combos]
+        finally:
+            # Don't keep the preloaded NAV frames alive in this process.
+            _worker_state.clear()
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=init_args
+        ) as executor:
+            rows = list(executor.map(_run_variant, combos))
+
+    return pd.DataFrame(rows)
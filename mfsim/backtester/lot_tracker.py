@@ -15,14 +15,32 @@ Example::
 
     gains = tracker.sell("Fund A", date(2024, 1, 1), units=120, price_per_unit=15.0)
     # First 100 units sold from the Jan lot, then 20 from the Jun lot (FIFO).
+
+Quantities are held internally as fixed-point integers (units in 1e-8 and
+prices in 1e-6 rupees) so repeated FIFO subtractions never accumulate
+rounding drift; the public ``units``/``cost_per_unit`` attributes and
+:class:`RealizedGain` fields are floats.
 """
 
+import sys
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 
+_UNIT_SCALE = 10**8  # 1 unit = 10**8 internal unit ticks
+_PRICE_SCALE = 10**6  # 1 rupee = 10**6 internal price ticks
+
+
+def _to_units_i(units: float) -> int:
+    return round(units * _UNIT_SCALE)
+
+
+def _to_price_i(price: float) -> int:
+    return round(price * _PRICE_SCALE)
 
-@dataclass
+
+@dataclass(slots=True, init=False, repr=False)
 class Lot:
     """A single purchase lot of a mutual fund.
 
@@ -32,16 +50,59 @@ class Lot:
         units: Number of units remaining in this lot (decremented on sells).
         cost_per_unit: NAV at the time of purchase.
         lot_id: Auto-generated 8-character identifier.
+
+    ``units`` and ``cost_per_unit`` are stored as ``1e-8`` unit ticks and
+    ``1e-6`` rupee ticks; reading or assigning them converts to and from
+    floats.
     """
 
     fund_name: str
     purchase_date: datetime
-    units: float
-    cost_per_unit: float
-    lot_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    _units_i: int
+    _cost_per_unit_i: int
+    lot_id: str
 
+    def __init__(
+        self,
+        fund_name: str,
+        purchase_date: datetime,
+        units: float,
+        cost_per_unit: float,
+        lot_id: str | None = None,
+    ):
+        self.fund_name = fund_name
+        self.purchase_date = purchase_date
+        self._units_i = _to_units_i(units)
+        self._cost_per_unit_i = _to_price_i(cost_per_unit)
+        self.lot_id = lot_id if lot_id is not None else str(uuid.uuid4())[:8]
+
+    def __repr__(self) -> str:
+        return (
+            f"Lot(fund_name={self.fund_name!r}, purchase_date={self.purchase_date!r}, "
+            f"units={self.units!r}, cost_per_unit={self.cost_per_unit!r}, "
+            f"lot_id={self.lot_id!r})"
+        )
+
+    @property
+    def units(self) -> float:
+        """Number of units remaining in this lot."""
+        return self._units_i / _UNIT_SCALE
+
+    @units.setter
+    def units(self, value: float) -> None:
+        self._units_i = _to_units_i(value)
+
+    @property
+    def cost_per_unit(self) -> float:
+        """NAV at the time of purchase."""
+        return self._cost_per_unit_i / _PRICE_SCALE
+
+    @cost_per_unit.setter
+    def cost_per_unit(self, value: float) -> None:
+        self._cost_per_unit_i = _to_price_i(value)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class RealizedGain:
     """Record of a realized gain/loss from selling units out of a specific lot.
 
@@ -71,13 +132,13 @@ class RealizedGain:
 class LotTracker:
     """Tracks fund purchases as individual lots and consumes them FIFO on sells.
 
-    Open lots are stored per fund in insertion order so that the oldest lot is
-    always consumed first when a sell occurs.  All realized gains are accumulated
-    and available via :attr:`realized_gains`.
+    Open lots are stored per fund in a ``deque`` in insertion order so that the
+    oldest lot is always consumed first (in O(1)) when a sell occurs.  All
+    realized gains are accumulated and available via :attr:`realized_gains`.
     """
 
     def __init__(self):
-        self.lots: dict[str, list[Lot]] = {}  # fund_name -> open lots (FIFO order)
+        self.lots: dict[str, deque[Lot]] = {}  # fund_name -> open lots (FIFO order)
         self.realized_gains: list[RealizedGain] = []
 
     def buy(self, fund_name: str, date: datetime, units: float, price_per_unit: float) -> Lot:
@@ -93,14 +154,13 @@ class LotTracker:
             The newly created :class:`Lot`.
         """
         lot = Lot(
-            fund_name=fund_name,
+            # Interned so every lot and realized gain shares one name object.
+            fund_name=sys.intern(str(fund_name)),
             purchase_date=date,
             units=units,
             cost_per_unit=price_per_unit,
         )
-        if fund_name not in self.lots:
-            self.lots[fund_name] = []
-        self.lots[fund_name].append(lot)
+        self.lots.setdefault(fund_name, deque()).append(lot)
         return lot
 
     def sell(
@@ -126,35 +186,41 @@ class LotTracker:
         if fund_name not in self.lots or not self.lots[fund_name]:
             raise ValueError(f"No lots available to sell for {fund_name}")
 
-        remaining = abs(units)  # units to sell
+        lots = self.lots[fund_name]
+        remaining = _to_units_i(abs(units))  # unit ticks to sell
+        sell_price_i = _to_price_i(price_per_unit)
         gains: list[RealizedGain] = []
 
-        while remaining > 1e-10 and self.lots[fund_name]:
-            lot = self.lots[fund_name][0]
-            sell_units = min(lot.units, remaining)
-
-            gain = RealizedGain(
-                lot_id=lot.lot_id,
-                fund_name=fund_name,
-                purchase_date=lot.purchase_date,
-                sell_date=date,
-                units=sell_units,
-                cost_per_unit=lot.cost_per_unit,
-                sell_price_per_unit=price_per_unit,
-                gain=(price_per_unit - lot.cost_per_unit) * sell_units,
-                holding_days=(date - lot.purchase_date).days,
-            )
-            gains.append(gain)
-
-            lot.units -= sell_units
-            remaining -= sell_units
-
-            if lot.units < 1e-10:
-                self.lots[fund_name].pop(0)
+        # Only the lots actually consumed are visited: O(lots consumed).
+        while remaining > 0 and lots:
+            lot = lots[0]
+            sell_units_i = min(lot._units_i, remaining)
+            gains.append(self._realize(lot, date, sell_units_i, sell_price_i))
+
+            lot._units_i -= sell_units_i
+            remaining -= sell_units_i
+
+            if lot._units_i == 0:
+                lots.popleft()
 
         self.realized_gains.extend(gains)
         return gains
 
+    @staticmethod
+    def _realize(lot: Lot, date: datetime, units_i: int, sell_price_i: int) -> RealizedGain:
+        """Build the :class:`RealizedGain` for selling ``units_i`` ticks of ``lot``."""
+        return RealizedGain(
+            lot_id=lot.lot_id,
+            fund_name=lot.fund_name,
+            purchase_date=lot.purchase_date,
+            sell_date=date,
+            units=units_i / _UNIT_SCALE,
+            cost_per_unit=lot.cost_per_unit,
+            sell_price_per_unit=sell_price_i / _PRICE_SCALE,
+            gain=(sell_price_i - lot._cost_per_unit_i) * units_i / (_PRICE_SCALE * _UNIT_SCALE),
+            holding_days=(date - lot.purchase_date).days,
+        )
+
     def get_holdings(self, fund_name: str) -> float:
         """Total units held in open lots for a fund.
 
@@ -164,7 +230,7 @@ class LotTracker:
         Returns:
             Sum of units across all open lots for the fund.
         """
-        return sum(lot.units for lot in self.lots.get(fund_name, []))
+        return sum(lot._units_i for lot in self.lots.get(fund_name, [])) / _UNIT_SCALE
 
     def get_all_holdings(self) -> dict[str, float]:
         """All fund holdings as ``{fund_name: total_units}``.
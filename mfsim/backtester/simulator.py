@@ -44,6 +44,7 @@ from mfsim.metrics.metrics_collection import (
     TotalReturnMetric,
     TrackingErrorMetric,
     XIRRMetric,
+    compute_portfolio_value_history,
 )
 from mfsim.strategies.base_strategy import BaseStrategy
 from mfsim.utils.data_loader import MfApiDataLoader, get_lowerbound_date
@@ -123,6 +124,8 @@ class Simulator:
         self.exit_loads = self._get_exit_load()
         self.start_date = get_lowerbound_date(self.nav_data[self.fund_list[0]], self.start_date)
         self.portfolio_history = []
+        self._history_df = None
+        self._history_df_rows = None
         self.metrics_results = {}
         self.lot_tracker = LotTracker()
         self.total_stamp_duty = 0.0
@@ -131,11 +134,9 @@ class Simulator:
 
         # Load benchmark NAV data if specified and not already in nav_data
         if self.benchmark_fund and self.benchmark_fund not in self.nav_data:
-            benchmark_nav = self.data_loader.load_nav_data(self.benchmark_fund)
-            benchmark_nav["date"] = pd.to_datetime(benchmark_nav["date"], format="%d-%m-%Y")
-            benchmark_nav["nav"] = benchmark_nav["nav"].astype(float)
-            benchmark_nav.set_index("date", inplace=True)
-            self.nav_data[self.benchmark_fund] = benchmark_nav
+            self.nav_data[self.benchmark_fund] = self._prepare_nav_frame(
+                self.data_loader.load_nav_data(self.benchmark_fund)
+            )
 
     @property
     def current_portfolio(self):
@@ -147,19 +148,24 @@ class Simulator:
         Returns:
             Dict mapping each fund name to total units currently held.
         """
-        df = pd.DataFrame.from_records(self.portfolio_history, index="date")
-        df = df.drop(columns=["amount"])
-        return df.groupby("fund_name")["units"].sum().to_dict()
+        return self.portfolio_history_df.groupby("fund_name")["units"].sum().to_dict()
 
     @property
     def portfolio_history_df(self):
         """Transaction history as a DataFrame.
 
+        ``portfolio_history`` is append-only, so the frame is rebuilt only
+        when transactions have been added since the last access; otherwise
+        the same frame is returned. Treat it as read-only.
+
         Returns:
             DataFrame indexed by ``date`` with columns ``fund_name``,
             ``units``, and ``amount``.
         """
-        return pd.DataFrame.from_records(self.portfolio_history, index="date")
+        if self._history_df_rows != len(self.portfolio_history):
+            self._history_df = pd.DataFrame.from_records(self.portfolio_history, index="date")
+            self._history_df_rows = len(self.portfolio_history)
+        return self._history_df
 
     @property
     def total_invested(self):
@@ -171,8 +177,19 @@ class Simulator:
         """
         if not self.portfolio_history:
             return 0.0
-        df = pd.DataFrame.from_records(self.portfolio_history)
-        return df["amount"].sum()
+        return self.portfolio_history_df["amount"].sum()
+
+    @property
+    def first_transaction_date(self):
+        """Date of the earliest recorded transaction.
+
+        Returns:
+            ``pd.Timestamp`` of the first purchase, or ``None`` if no
+            transactions have been made yet.
+        """
+        if not self.portfolio_history:
+            return None
+        return self.portfolio_history_df.index.min()
 
     @property
     def lots(self):
@@ -267,20 +284,49 @@ class Simulator:
         """Fetch and prepare NAV data for all funds in the strategy.
 
         For each fund in ``strategy.fund_list``, calls the data loader's
-        ``load_nav_data()`` method, converts dates to datetime, NAVs to
-        float, and sets date as the DataFrame index.
+        ``load_nav_data()`` method and prepares the result with
+        :meth:`_prepare_nav_frame`.
 
         Returns:
             Dict mapping fund names to DataFrames indexed by ``date``
             with a ``nav`` column (float).
         """
-        nav_data = {}
-        for fund in self.fund_list:
-            nav_data[fund] = self.data_loader.load_nav_data(fund)
-            nav_data[fund]["date"] = pd.to_datetime(nav_data[fund]["date"], format="%d-%m-%Y")
-            nav_data[fund]["nav"] = nav_data[fund]["nav"].astype(float)
-            nav_data[fund].set_index("date", inplace=True)
-        return nav_data
+        return {
+            fund: self._prepare_nav_frame(self.data_loader.load_nav_data(fund))
+            for fund in self.fund_list
+        }
+
+    @staticmethod
+    def _prepare_nav_frame(df):
+        """Index a loaded NAV frame by date and make ``nav`` float.
+
+        The ``DatetimeIndex`` is built once, directly from the ``date``
+        column. Dates that are already ``datetime64`` are not re-parsed,
+        and frames a loader returns already indexed by a ``DatetimeIndex``
+        are used as they are. The result is sorted ascending by date so
+        date lookups can binary-search the index.
+
+        Args:
+            df: Frame returned by ``load_nav_data()``.
+
+        Returns:
+            DataFrame indexed by ascending ``date`` with a float ``nav``
+            column.
+        """
+        if "date" in df.columns:
+            dates = df["date"]
+            if not pd.api.types.is_datetime64_any_dtype(dates):
+                dates = pd.to_datetime(dates, format="%d-%m-%Y")
+            df = df.drop(columns="date").set_axis(pd.DatetimeIndex(dates, name="date"))
+        elif not isinstance(df.index, pd.DatetimeIndex):
+            raise ValueError("NAV data needs a 'date' column or a DatetimeIndex")
+        if not df.index.is_monotonic_increasing:
+            # mfapi lists newest NAVs first; reversing is enough for that.
+            if df.index.is_monotonic_decreasing:
+                df = df.iloc[::-1]
+            else:
+                df = df.sort_index(kind="stable")
+        return df.astype({"nav": float})
 
     def calculate_units_for_amount(self, fund_name, date, amount):
         """Convert a rupee amount to fund units at the NAV on a given date.
@@ -378,6 +424,22 @@ class Simulator:
 
             self.logger.info(f"Applied SIP of {self.sip_amount} on {current_date.date()}")
 
+    def _execute_orders(self, orders, date):
+        """Apply the buy/sell orders returned by ``strategy.rebalance()``.
+
+        Args:
+            orders: Either a list of order dicts or a DataFrame with
+                ``fund_name`` and ``amount`` columns (one row per order).
+                DataFrames are consumed with ``itertuples`` in a single pass.
+            date: The rebalance date on which the orders execute.
+        """
+        if isinstance(orders, pd.DataFrame):
+            pairs = orders[["fund_name", "amount"]].itertuples(index=False, name=None)
+        else:
+            pairs = ((order["fund_name"], order["amount"]) for order in orders)
+        for fund_name, amount in pairs:
+            self.make_purchase(fund_name, date, amount)
+
     def run(self):
         """Execute the full backtest simulation.
 
@@ -417,10 +479,7 @@ class Simulator:
                 self.logger.info(f"Rebalancing on {date.date()}")
                 current_portfolio = self.current_portfolio
                 orders = self.strategy.rebalance(current_portfolio, self.nav_data, date)
-                for order in orders:
-                    fund_name = order["fund_name"]
-                    amount = order["amount"]
-                    self.make_purchase(fund_name, date, amount)
+                self._execute_orders(orders, date)
 
         # After simulation, calculate metrics
         self._calculate_metrics()
@@ -583,13 +642,23 @@ class Simulator:
             else:
                 self.logger.warning(f"Unknown metric: {metric_name}")
 
+        # Metrics that work from the daily value history share one copy of
+        # it rather than each rebuilding the (days x funds) reconstruction.
+        values = None
+        if any(metric.uses_value_history for metric in metrics_instances):
+            values = compute_portfolio_value_history(
+                self.portfolio_history_df, self.nav_data, self.end_date
+            )
+
         for metric in metrics_instances:
             metric_name = metric.__class__.__name__.replace("Metric", "").replace("_", " ")
+            extra = {"values": values} if metric.uses_value_history else {}
             self.metrics_results[metric_name] = metric.calculate(
                 self.portfolio_history_df,
                 self.current_portfolio,
                 self.end_date,
                 self.nav_data,
+                **extra,
             )
             self.logger.info(f"{metric_name}: {self.metrics_results[metric_name]}")
 
@@ -23,7 +23,6 @@ Usage:
 
 import logging
 import os
-import re
 
 import hydra
 import pandas as pd
@@ -32,7 +31,7 @@ from omegaconf import DictConfig, OmegaConf, open_dict
 from mfsim.backtester.simulator import Simulator
 from mfsim.strategies.base_strategy import BaseStrategy
 from mfsim.strategies.custom_strategy import MomentumValueStrategy
-from mfsim.utils.data_loader import BaseDataLoader, MfApiDataLoader
+from mfsim.utils.data_loader import BaseDataLoader, IndexCsvDataLoader, MfApiDataLoader
 
 log = logging.getLogger(__name__)
 
@@ -160,49 +159,6 @@ def build_strategy(cfg: DictConfig) -> BaseStrategy:
 # ---------------------------------------------------------------------------
 
 
-class IndexCsvDataLoader(BaseDataLoader):
-    """Load index NAV data from local CSV files with *_Historical_PR_* naming."""
-
-    def __init__(self, data_dir):
-        super().__init__(data_dir=data_dir)
-        self.data_dir = data_dir
-        self.index_dfs = self._load_all_csvs()
-
-    def _load_all_csvs(self):
-        dfs = {}
-        csv_files = [
-            f for f in os.listdir(self.data_dir) if f.endswith(".csv") and "_Historical_PR_" in f
-        ]
-        for file in csv_files:
-            match = re.match(r"(.*?)_Historical_PR_.*\.csv", file)
-            if match:
-                index_name = match.group(1).strip().replace(" ", "_").replace("-", "_")
-                df = pd.read_csv(os.path.join(self.data_dir, file))
-                # Standardize column names
-                for col in df.columns:
-                    if "date" in col.lower():
-                        if col != "date":
-                            df.rename(columns={col: "date"}, inplace=True)
-                        break
-                if "Close" in df.columns:
-                    df.rename(columns={"Close": "nav"}, inplace=True)
-                if "date" in df.columns:
-                    df["date"] = pd.to_datetime(df["date"], errors="coerce")
-                dfs[index_name] = df
-        return dfs
-
-    def load_nav_data(self, fund_name):
-        key = fund_name.replace(" ", "_")
-        if key not in self.index_dfs:
-            raise ValueError(
-                f"Index '{fund_name}' not found. Available: {list(self.index_dfs.keys())}"
-            )
-        df = self.index_dfs[key][["date", "nav"]].copy()
-        df = df.sort_values("date")
-        df["nav"] = df["nav"].astype(float)
-        return df.reset_index(drop=True)
-
-
 def build_data_loader(cfg: DictConfig) -> BaseDataLoader:
     """Instantiate the right data loader from the Hydra config."""
     dl_type = cfg.data_loader.type
@@ -0,0 +1,116 @@
+"""
+Compiled inner loops used by the built-in metrics.
+
+numba is an optional dependency (``pip install mfsim[fast]``). When it is
+installed the kernels are JIT-compiled single-pass loops; otherwise the same
+names fall back to equivalent NumPy expressions, so callers never need to
+check which implementation they got.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - exercised only without numba
+    njit = None
+
+
+def _max_drawdown_loop(values):
+    """Largest peak-to-trough decline of ``values`` as a decimal <= 0.
+
+    Args:
+        values: 1-D ``float64`` array of portfolio values in date order.
+
+    Returns:
+        ``min(values / running_peak - 1)``, or ``0.0`` if values never fell.
+    """
+    # One pass with a scalar running peak: no intermediate arrays. Points
+    # before the first positive value have no peak to draw down from.
+    peak = 0.0
+    mdd = 0.0
+    for i in range(values.shape[0]):
+        x = values[i]
+        if x > peak:
+            peak = x
+        if peak > 0.0:
+            d = x / peak - 1.0
+            if d < mdd:
+                mdd = d
+    return mdd
+
+
+def _max_drawdown_numpy(values):
+    """NumPy equivalent of :func:`_max_drawdown_loop`."""
+    peak = np.maximum.accumulate(values)
+    has_peak = peak > 0.0
+    drawdown = values[has_peak] / peak[has_peak] - 1.0
+    return float(min(drawdown.min(), 0.0)) if drawdown.size else 0.0
+
+
+if njit is not None:
+    # fastmath is safe here: portfolio values are NaN-free (zero-filled).
+    max_drawdown = njit(cache=True, fastmath=True)(_max_drawdown_loop)
+else:  # pragma: no cover - exercised only without numba
+    max_drawdown = _max_drawdown_numpy
+
+
+def _xirr_newton_loop(amounts, day_offsets, guess, tol, maxiter):
+    """Solve ``sum(amounts / (1 + r) ^ (day_offsets / 365)) = 0`` for ``r``.
+
+    Newton-Raphson with the analytic derivative: NPV and its derivative are
+    accumulated together in one pass per iteration. A step that would cross
+    ``r = -1`` is halved towards it instead.
+
+    Args:
+        amounts: 1-D ``float64`` array of signed cash flows.
+        day_offsets: 1-D ``float64`` array of days since the first flow.
+        guess: Starting rate.
+        tol: Convergence tolerance on the step size.
+        maxiter: Maximum number of iterations.
+
+    Returns:
+        The annualized rate, or NaN if the solver does not converge.
+    """
+    rate = guess
+    for _ in range(maxiter):
+        f = 0.0
+        fp = 0.0
+        for i in range(amounts.shape[0]):
+            t = day_offsets[i] / 365.0
+            disc = (1.0 + rate) ** -t
+            f += amounts[i] * disc
+            fp -= t * amounts[i] * disc / (1.0 + rate)
+        if fp == 0.0 or not np.isfinite(f / fp):
+            return np.nan
+        new_rate = rate - f / fp
+        if new_rate <= -1.0:
+            new_rate = (rate - 1.0) / 2.0
+        if abs(new_rate - rate) < tol:
+            return new_rate
+        rate = new_rate
+    return np.nan
+
+
+def _xirr_newton_numpy(amounts, day_offsets, guess, tol, maxiter):
+    """NumPy equivalent of :func:`_xirr_newton_loop`."""
+    t = day_offsets / 365.0
+    rate = guess
+    for _ in range(maxiter):
+        disc = (1.0 + rate) ** -t
+        f = float(np.dot(amounts, disc))
+        fp = -float(np.dot(t * amounts, disc)) / (1.0 + rate)
+        if fp == 0.0 or not np.isfinite(f / fp):
+            return np.nan
+        new_rate = rate - f / fp
+        if new_rate <= -1.0:
+            new_rate = (rate - 1.0) / 2.0
+        if abs(new_rate - rate) < tol:
+            return new_rate
+        rate = new_rate
+    return np.nan
+
+
+if njit is not None:
+    xirr_newton = njit(cache=True)(_xirr_newton_loop)
+else:  # pragma: no cover - exercised only without numba
+    xirr_newton = _xirr_newton_numpy
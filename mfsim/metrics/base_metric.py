@@ -22,8 +22,18 @@ class BaseMetric(ABC):
 
     Metrics are stateless calculators — they receive the full simulation
     state after the backtest completes and return a single numeric value.
+
+    Attributes:
+        uses_value_history: Set to ``True`` in subclasses whose
+            :meth:`calculate` accepts a ``values`` keyword: the daily
+            portfolio value series from
+            :func:`~mfsim.metrics.metrics_collection.compute_portfolio_value_history`.
+            The simulator builds that series once and shares it between
+            every such metric instead of each one rebuilding it.
     """
 
+    uses_value_history = False
+
     @abstractmethod
     def calculate(self, portfolio_history, current_portfolio, date, nav_data) -> float:
         """Compute the metric value from the simulation results.
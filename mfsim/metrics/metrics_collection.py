@@ -16,10 +16,12 @@ Available metrics:
     - :class:`TaxAwareReturnMetric` — post-tax total return using Indian MF tax rules
 """
 
+import math
+
 import numpy as np
 import pandas as pd
-from scipy.optimize import newton
 
+from ._numba_kernels import max_drawdown, xirr_newton
 from .base_metric import BaseMetric
 
 
@@ -39,30 +41,63 @@ def compute_portfolio_value_history(portfolio_history, nav_data, current_date):
     Returns:
         pandas Series indexed by date with portfolio value as values.
     """
-    portfolio_history = portfolio_history.sort_values("date")
-
     all_dates = pd.date_range(start=portfolio_history.index.min(), end=current_date, freq="D")
-
-    holdings_df = pd.DataFrame(index=all_dates, columns=nav_data.keys()).fillna(0.0)
-
-    for txn_date, row in portfolio_history.iterrows():
-        if txn_date > current_date:
-            continue
-        fund = row["fund_name"]
-        units = row["units"]
-        holdings_df.loc[txn_date:, fund] += units
-
-    portfolio_values = pd.Series(0.0, index=all_dates, dtype=float)
-    for fund, nav_df in nav_data.items():
-        nav_df = nav_df[nav_df.index <= current_date]
-        # Reindex to all calendar days and forward-fill so weekends/holidays
-        # carry the last known NAV instead of producing NaN/zero.
-        nav_aligned = nav_df["nav"].reindex(all_dates).ffill()
-        holdings = holdings_df[fund]
-        portfolio_values += holdings * nav_aligned
-
-    portfolio_values = portfolio_values.fillna(0.0)
-    return portfolio_values
+    funds = pd.Index(list(nav_data))
+
+    # Scatter each transaction's units onto the first day on or after its
+    # date; a cumulative sum down the (days x funds) matrix is then the
+    # units held each day. Funds without NAV data are ignored.
+    history = portfolio_history[portfolio_history.index <= current_date]
+    rows = all_dates.searchsorted(history.index, side="left")
+    cols = funds.get_indexer(history["fund_name"])
+    keep = (cols >= 0) & (rows < len(all_dates))
+    units = np.zeros((len(all_dates), len(funds)))
+    np.add.at(units, (rows[keep], cols[keep]), history["units"].to_numpy(dtype=float)[keep])
+    units = units.cumsum(axis=0)
+
+    # Reindex to all calendar days and forward-fill so weekends/holidays
+    # carry the last known NAV instead of producing NaN/zero.
+    navs = np.empty_like(units)
+    for j, nav_df in enumerate(nav_data.values()):
+        nav = nav_df.loc[nav_df.index <= current_date, "nav"]
+        navs[:, j] = nav.reindex(all_dates).ffill().to_numpy(dtype=float)
+
+    portfolio_values = pd.Series((units * navs).sum(axis=1), index=all_dates)
+    return portfolio_values.fillna(0.0)
+
+
+def _value_history(values, portfolio_history, nav_data, date):
+    """``values`` if the caller already built the value history, else build it."""
+    if values is None:
+        values = compute_portfolio_value_history(portfolio_history, nav_data, date)
+    return values
+
+
+def _nav_on_date(nav_df, date):
+    """NAV on exactly ``date``, or NaN if the frame has no row for it.
+
+    ``nav_df`` may carry its dates as a ``date`` column or as an index named
+    ``date``. Sorted datetime dates (the usual case) are binary-searched
+    instead of scanned with a boolean mask.
+
+    Raises:
+        ValueError: If ``nav_df`` has neither a ``date`` column nor index.
+    """
+    if "date" in nav_df.columns:
+        dates = pd.Index(nav_df["date"])
+    elif nav_df.index.name == "date":
+        dates = nav_df.index
+    else:
+        raise ValueError("Invalid NAV data format. Expected 'date' as column or index.")
+
+    navs = nav_df["nav"].to_numpy()
+    if isinstance(dates, pd.DatetimeIndex) and dates.is_monotonic_increasing:
+        pos = dates.searchsorted(date)
+        if pos < len(dates) and dates[pos] == date:
+            return float(navs[pos])
+        return float("nan")
+    matches = navs[dates == date]
+    return float(matches[0]) if len(matches) else float("nan")
 
 
 class XIRRMetric(BaseMetric):
@@ -80,9 +115,14 @@ class XIRRMetric(BaseMetric):
         3. Solves for rate ``r`` where the net present value of all
            cash flows equals zero:
            ``NPV = sum(cf_i / (1 + r) ^ ((date_i - date_0) / 365))``
-        4. Uses Newton's method (``scipy.optimize.newton``) for root-finding.
-
-    Returns ``float('nan')`` if the solver fails to converge.
+        4. Uses Newton's method with the analytic derivative for
+           root-finding (a compiled kernel when numba is installed).
+           A single investment followed by a single terminal value has the
+           closed form ``(-cf_1 / cf_0) ^ (365 / days) - 1``, so that case
+           skips the solver.
+
+    Returns ``float('nan')`` if the solver fails to converge or the rate
+    overflows a float.
     """
 
     def calculate(self, portfolio_history, current_portfolio, date, nav_data):
@@ -113,34 +153,27 @@ class XIRRMetric(BaseMetric):
         # Final portfolio value as a positive cash flow on the end date
         final_value = 0
         for fund, units in current_portfolio.items():
-            nav = nav_data[fund]
-            if "date" in nav.columns:
-                nav_on_date = nav.loc[nav["date"] == date, "nav"]
-            elif nav.index.name == "date":
-                nav_on_date = nav.loc[[date], "nav"] if date in nav.index else pd.Series([])
-            else:
-                nav_on_date = pd.Series([])
-            if not nav_on_date.empty:
-                final_value += units * nav_on_date.values[0]
+            nav = _nav_on_date(nav_data[fund], date)
+            if not np.isnan(nav):
+                final_value += units * nav
         if final_value != 0:
             cash_flows.append(final_value)
             dates.append(date)
 
-        def xnpv(rate, cashflows, dates):
-            t0 = dates[0]
-            return sum(
-                cf / (1 + rate) ** ((d - t0).days / 365.0) for cf, d in zip(cashflows, dates)
-            )
-
-        def xirr(cashflows, dates, guess=0.1):
-            try:
-                return newton(lambda r: xnpv(r, cashflows, dates), guess)
-            except (RuntimeError, OverflowError):
-                return float("nan")
-
         if len(cash_flows) < 2:
             return float("nan")
-        return float(xirr(cash_flows, dates))
+        if len(cash_flows) == 2 and cash_flows[0] * cash_flows[1] < 0:
+            days = (dates[1] - dates[0]).days
+            if days > 0:
+                try:
+                    rate = (-cash_flows[1] / cash_flows[0]) ** (365.0 / days) - 1.0
+                except OverflowError:
+                    # A large gain over a short span has no representable rate.
+                    return float("nan")
+                return float(rate) if math.isfinite(rate) else float("nan")
+        amounts = np.asarray(cash_flows, dtype=np.float64)
+        day_offsets = np.array([(d - dates[0]).days for d in dates], dtype=np.float64)
+        return float(xirr_newton(amounts, day_offsets, 0.1, 1.48e-8, 50))
 
 
 class TotalReturnMetric(BaseMetric):
@@ -170,21 +203,26 @@ class TotalReturnMetric(BaseMetric):
         money_invested = portfolio_history["amount"].sum()
         final_value = 0
         for fund, units in current_portfolio.items():
-            nav_df = nav_data[fund]
-            if "date" in nav_df.columns:
-                nav_on_date = nav_df.loc[nav_df["date"] == date, "nav"]
-            elif nav_df.index.name == "date":
-                nav_on_date = nav_df.loc[[date], "nav"] if date in nav_df.index else pd.Series([])
-            else:
-                raise ValueError(
-                    f"Invalid NAV data format for fund {fund}. Expected 'date' as column or index."
-                )
-            if not nav_on_date.empty:
-                final_value += units * nav_on_date.values[0]
+            nav = _nav_on_date(nav_data[fund], date)
+            if not np.isnan(nav):
+                final_value += units * nav
         total_return = (final_value / money_invested) - 1
         return float(total_return)
 
 
+def _simple_returns(portfolio_values):
+    """Period-over-period simple returns of a value series, as a ``float64`` array.
+
+    Equivalent to ``portfolio_values.pct_change().dropna()``: periods that
+    start and end at zero (``0 / 0``) are dropped. The value history is
+    already in date order, so no sort is needed.
+    """
+    values = portfolio_values.to_numpy(dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = values[1:] / values[:-1] - 1.0
+    return returns[~np.isnan(returns)]
+
+
 class SharpeRatioMetric(BaseMetric):
     """Risk-adjusted return using the Sharpe Ratio.
 
@@ -209,11 +247,13 @@ class SharpeRatioMetric(BaseMetric):
         or if portfolio volatility is zero.
     """
 
+    uses_value_history = True
+
     def __init__(self, risk_free_rate=0.06, frequency="daily"):
         self.risk_free_rate = risk_free_rate
         self.frequency = frequency
 
-    def calculate(self, portfolio_history, current_portfolio, date, nav_data):
+    def calculate(self, portfolio_history, current_portfolio, date, nav_data, values=None):
         """Compute the annualized Sharpe Ratio.
 
         Args:
@@ -221,16 +261,16 @@ class SharpeRatioMetric(BaseMetric):
             current_portfolio: Final holdings ``{fund_name: units}``.
             date: Simulation end date.
             nav_data: Fund NAV data dict.
+            values: Precomputed value history, or ``None`` to build it.
 
         Returns:
             Annualized Sharpe Ratio as a float.
         """
-        portfolio_values = compute_portfolio_value_history(portfolio_history, nav_data, date)
+        portfolio_values = _value_history(values, portfolio_history, nav_data, date)
         if portfolio_values.empty or len(portfolio_values) < 2:
             return np.nan
 
-        portfolio_values = portfolio_values.sort_index()
-        daily_returns = portfolio_values.pct_change().dropna()
+        daily_returns = _simple_returns(portfolio_values)
 
         if self.frequency == "daily":
             rf_daily = self.risk_free_rate / 252
@@ -242,9 +282,11 @@ class SharpeRatioMetric(BaseMetric):
             raise ValueError("Unsupported frequency. Use 'daily' or 'monthly'.")
 
         excess_returns = daily_returns - rf_daily
+        if excess_returns.size < 2:
+            return np.nan
 
         mean_excess_return = excess_returns.mean()
-        std_excess_return = excess_returns.std()
+        std_excess_return = excess_returns.std(ddof=1)
 
         if std_excess_return == 0:
             return np.nan
@@ -264,7 +306,9 @@ class MaximumDrawdownMetric(BaseMetric):
     (same approach as :class:`SharpeRatioMetric`) to compute drawdown.
     """
 
-    def calculate(self, portfolio_history, current_portfolio, date, nav_data):
+    uses_value_history = True
+
+    def calculate(self, portfolio_history, current_portfolio, date, nav_data, values=None):
         """Compute maximum drawdown.
 
         Args:
@@ -272,21 +316,20 @@ class MaximumDrawdownMetric(BaseMetric):
             current_portfolio: Final holdings ``{fund_name: units}``.
             date: Simulation end date.
             nav_data: Fund NAV data dict.
+            values: Precomputed value history, or ``None`` to build it.
 
         Returns:
             Maximum drawdown as a negative decimal (e.g., ``-0.20``
             for a 20% drawdown). Returns ``0.0`` if portfolio value
             never declined.
         """
-        portfolio_values = compute_portfolio_value_history(portfolio_history, nav_data, date)
+        portfolio_values = _value_history(values, portfolio_history, nav_data, date)
         if portfolio_values.empty or len(portfolio_values) < 2:
             return 0.0
 
-        portfolio_values = portfolio_values.sort_index()
-        rolling_max = portfolio_values.cummax()
-        drawdown = (portfolio_values - rolling_max) / rolling_max
-        max_drawdown = drawdown.min()
-        return float(max_drawdown)
+        # The value history is built on an ascending daily range, so no sort
+        # is needed; the kernel walks it once with a scalar running peak.
+        return float(max_drawdown(portfolio_values.to_numpy(dtype=np.float64)))
 
 
 class SortinoRatioMetric(BaseMetric):
@@ -308,11 +351,13 @@ class SortinoRatioMetric(BaseMetric):
             ``'monthly'``. Default ``'daily'``.
     """
 
+    uses_value_history = True
+
     def __init__(self, risk_free_rate=0.05, frequency="daily"):
         self.risk_free_rate = risk_free_rate
         self.frequency = frequency
 
-    def calculate(self, portfolio_history, current_portfolio, date, nav_data):
+    def calculate(self, portfolio_history, current_portfolio, date, nav_data, values=None):
         """Compute the annualized Sortino Ratio.
 
         Args:
@@ -320,27 +365,29 @@ class SortinoRatioMetric(BaseMetric):
             current_portfolio: Final holdings ``{fund_name: units}``.
             date: Simulation end date.
             nav_data: Fund NAV data dict.
+            values: Precomputed value history, or ``None`` to build it.
 
         Returns:
             Annualized Sortino Ratio as a float. Returns ``float('nan')``
             if there are fewer than 2 data points or no downside deviation.
         """
-        portfolio_values = compute_portfolio_value_history(portfolio_history, nav_data, date)
+        portfolio_values = _value_history(values, portfolio_history, nav_data, date)
         if portfolio_values.empty or len(portfolio_values) < 2:
             return np.nan
 
-        portfolio_values = portfolio_values.sort_index()
-        returns = portfolio_values.pct_change().dropna()
+        returns = _simple_returns(portfolio_values)
 
         periods_per_year = self._get_periods_per_year()
         excess_returns = returns - self.risk_free_rate / periods_per_year
         downside_returns = excess_returns[excess_returns < 0]
 
-        if downside_returns.empty or downside_returns.std() == 0:
+        if downside_returns.size < 2:
+            return np.nan
+        downside_deviation = downside_returns.std(ddof=1)
+        if downside_deviation == 0:
             return np.nan
 
         expected_return = excess_returns.mean()
-        downside_deviation = downside_returns.std()
         sortino_ratio = (expected_return / downside_deviation) * np.sqrt(periods_per_year)
         return float(sortino_ratio)
 
@@ -369,10 +416,12 @@ class AlphaMetric(BaseMetric):
         benchmark_fund: Name of the fund in ``nav_data`` to use as benchmark.
     """
 
+    uses_value_history = True
+
     def __init__(self, benchmark_fund: str):
         self.benchmark_fund = benchmark_fund
 
-    def calculate(self, portfolio_history, current_portfolio, date, nav_data):
+    def calculate(self, portfolio_history, current_portfolio, date, nav_data, values=None):
         """Compute annualized alpha vs the benchmark.
 
         Args:
@@ -380,12 +429,13 @@ class AlphaMetric(BaseMetric):
             current_portfolio: Final holdings ``{fund_name: units}``.
             date: Simulation end date.
             nav_data: Fund NAV data dict.
+            values: Precomputed value history, or ``None`` to build it.
 
         Returns:
             Annualized alpha as a decimal. Returns ``float('nan')`` if
             insufficient data.
         """
-        portfolio_values = compute_portfolio_value_history(portfolio_history, nav_data, date)
+        portfolio_values = _value_history(values, portfolio_history, nav_data, date)
         if portfolio_values.empty or len(portfolio_values) < 2:
             return np.nan
 
@@ -422,10 +472,12 @@ class TrackingErrorMetric(BaseMetric):
         benchmark_fund: Name of the fund in ``nav_data`` to use as benchmark.
     """
 
+    uses_value_history = True
+
     def __init__(self, benchmark_fund: str):
         self.benchmark_fund = benchmark_fund
 
-    def calculate(self, portfolio_history, current_portfolio, date, nav_data):
+    def calculate(self, portfolio_history, current_portfolio, date, nav_data, values=None):
         """Compute annualized tracking error.
 
         Args:
@@ -433,12 +485,13 @@ class TrackingErrorMetric(BaseMetric):
             current_portfolio: Final holdings ``{fund_name: units}``.
             date: Simulation end date.
             nav_data: Fund NAV data dict.
+            values: Precomputed value history, or ``None`` to build it.
 
         Returns:
             Annualized tracking error as a decimal. Returns ``float('nan')``
             if insufficient data.
         """
-        portfolio_values = compute_portfolio_value_history(portfolio_history, nav_data, date)
+        portfolio_values = _value_history(values, portfolio_history, nav_data, date)
         if portfolio_values.empty or len(portfolio_values) < 2:
             return np.nan
 
@@ -471,10 +524,12 @@ class InformationRatioMetric(BaseMetric):
         benchmark_fund: Name of the fund in ``nav_data`` to use as benchmark.
     """
 
+    uses_value_history = True
+
     def __init__(self, benchmark_fund: str):
         self.benchmark_fund = benchmark_fund
 
-    def calculate(self, portfolio_history, current_portfolio, date, nav_data):
+    def calculate(self, portfolio_history, current_portfolio, date, nav_data, values=None):
         """Compute annualized information ratio.
 
         Args:
@@ -482,12 +537,13 @@ class InformationRatioMetric(BaseMetric):
             current_portfolio: Final holdings ``{fund_name: units}``.
             date: Simulation end date.
             nav_data: Fund NAV data dict.
+            values: Precomputed value history, or ``None`` to build it.
 
         Returns:
             Annualized information ratio as a float. Returns ``float('nan')``
             if insufficient data or zero tracking error.
         """
-        portfolio_values = compute_portfolio_value_history(portfolio_history, nav_data, date)
+        portfolio_values = _value_history(values, portfolio_history, nav_data, date)
         if portfolio_values.empty or len(portfolio_values) < 2:
             return np.nan
 
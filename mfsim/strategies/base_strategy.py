@@ -32,6 +32,8 @@ Example — a fixed-allocation strategy::
 from abc import ABC, abstractmethod
 import logging
 
+import pandas as pd
+
 
 class BaseStrategy(ABC):
     """Abstract base class that all strategies must inherit from.
@@ -104,7 +106,7 @@ class BaseStrategy(ABC):
         return equal_allocation
 
     @abstractmethod
-    def rebalance(self, portfolio, nav_data, current_date) -> list[dict]:
+    def rebalance(self, portfolio, nav_data, current_date) -> list[dict] | pd.DataFrame:
         """Define the rebalancing logic. **Must be implemented by subclasses.**
 
         Called by the simulator on every rebalance date (determined by
@@ -126,6 +128,8 @@ class BaseStrategy(ABC):
             - ``'amount'``: Rupee amount. **Positive = buy, negative = sell.**
 
             Return an empty list ``[]`` to skip rebalancing on this date.
+            Strategies that build many orders at once may instead return a
+            ``pd.DataFrame`` with ``fund_name`` and ``amount`` columns.
 
         Example::
 
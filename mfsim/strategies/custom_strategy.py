@@ -6,7 +6,9 @@ a configurable lookback period, and shifts 10% of holdings toward the
 outperformer on each rebalance date.
 """
 
+import numpy as np
 import pandas as pd
+
 from .base_strategy import BaseStrategy
 from ..utils.data_loader import get_lowerbound_date
 
@@ -49,6 +51,8 @@ class MomentumValueStrategy(BaseStrategy):
         self.value_fund = value_fund
         self.momentum_fund = momentum_fund
         self.momentum_period = momentum_period
+        self._start_pos_index = None
+        self._start_pos_table = None
 
     def allocate_money(self, money_invested, nav_data, current_date):
         """Split money equally between the two funds.
@@ -58,6 +62,37 @@ class MomentumValueStrategy(BaseStrategy):
         """
         return super().allocate_money(money_invested, nav_data, current_date)
 
+    def _lookback_dates(self, nav_df, current_date):
+        """Return ``(start_date, current_date)`` snapped to trading days in ``nav_df``.
+
+        For an ascending index, the position of ``date - momentum_period``
+        is precomputed for every date with one vectorized ``searchsorted``
+        and reused on later rebalances, so a rebalance on a trading day is
+        a table lookup instead of a fresh search. The simulator always
+        passes ascending frames; other orders fall back to
+        :func:`get_lowerbound_date`.
+        """
+        index = nav_df.index
+        lookback = pd.Timedelta(days=self.momentum_period)
+        if not index.is_monotonic_increasing:
+            start_date = get_lowerbound_date(nav_df, current_date - lookback)
+            return start_date, get_lowerbound_date(nav_df, current_date)
+
+        if self._start_pos_index is not index:
+            dates = index.values
+            shifted = dates - np.timedelta64(self.momentum_period, "D")
+            self._start_pos_table = np.searchsorted(dates, shifted, side="left")
+            self._start_pos_index = index
+
+        cur_pos = index.searchsorted(current_date, side="left")
+        if cur_pos >= len(index):
+            return get_lowerbound_date(nav_df, current_date - lookback), pd.NaT
+        if index[cur_pos] == current_date:
+            start_pos = self._start_pos_table[cur_pos]
+        else:
+            start_pos = index.searchsorted(current_date - lookback, side="left")
+        return index[start_pos], index[cur_pos]
+
     def rebalance(self, portfolio, nav_data, current_date):
         """Shift 10% of holdings toward the better-performing fund.
 
@@ -81,58 +116,25 @@ class MomentumValueStrategy(BaseStrategy):
         value_fund = self.value_fund
 
         # Calculate trailing returns over the lookback period
-        start_date = current_date - pd.Timedelta(days=self.momentum_period)
-        start_date = get_lowerbound_date(nav_data[momentum_fund], start_date)
-        current_date = get_lowerbound_date(nav_data[momentum_fund], current_date)
+        start_date, current_date = self._lookback_dates(nav_data[momentum_fund], current_date)
         try:
-            momentum_returns = (
-                nav_data[momentum_fund]["nav"].loc[current_date]
-                / nav_data[momentum_fund]["nav"].loc[start_date]
-            ) - 1
-            value_returns = (
-                nav_data[value_fund]["nav"].loc[current_date]
-                / nav_data[value_fund]["nav"].loc[start_date]
-            ) - 1
+            momentum_navs = nav_data[momentum_fund]["nav"]
+            value_navs = nav_data[value_fund]["nav"]
+            momentum_nav = float(momentum_navs.loc[current_date])
+            value_nav = float(value_navs.loc[current_date])
+            momentum_returns = momentum_nav / momentum_navs.loc[start_date] - 1
+            value_returns = value_nav / value_navs.loc[start_date] - 1
         except KeyError as e:
             raise ValueError(f"Missing NAV data for {e}")
 
-        orders = []
-
         if momentum_returns > value_returns:
             # Momentum outperformed — shift 10% from value to momentum
-            shift_amount = (
-                0.1
-                * portfolio.get(value_fund, 0)
-                * nav_data[value_fund]["nav"].loc[current_date].astype(float)
-            )
-            orders.append({"fund_name": value_fund, "amount": -shift_amount, "date": current_date})
-            orders.append(
-                {
-                    "fund_name": momentum_fund,
-                    "amount": shift_amount,
-                    "date": current_date,
-                }
-            )
+            shift_amount = 0.1 * portfolio.get(value_fund, 0) * value_nav
         else:
             # Value outperformed — shift 10% from momentum to value
-            shift_amount = (
-                0.1
-                * portfolio.get(momentum_fund, 0)
-                * nav_data[momentum_fund]["nav"].loc[current_date].astype(float)
-            )
-            orders.append(
-                {
-                    "fund_name": value_fund,
-                    "amount": shift_amount,
-                    "date": current_date,
-                }
-            )
-            orders.append(
-                {
-                    "fund_name": momentum_fund,
-                    "amount": -shift_amount,
-                    "date": current_date,
-                }
-            )
-
-        return orders
+            shift_amount = -0.1 * portfolio.get(momentum_fund, 0) * momentum_nav
+
+        return [
+            {"fund_name": value_fund, "amount": -shift_amount, "date": current_date},
+            {"fund_name": momentum_fund, "amount": shift_amount, "date": current_date},
+        ]
@@ -1,6 +1,6 @@
 # mutual_fund_backtester/utils/__init__.py
 
-from .data_loader import BaseDataLoader, MfApiDataLoader
+from .data_loader import BaseDataLoader, IndexCsvDataLoader, MfApiDataLoader
 from .logger import setup_logger
 
-__all__ = ["BaseDataLoader", "MfApiDataLoader", "setup_logger"]
+__all__ = ["BaseDataLoader", "MfApiDataLoader", "IndexCsvDataLoader", "setup_logger"]
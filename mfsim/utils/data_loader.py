@@ -1,8 +1,9 @@
 """
 Data loading abstractions for NAV and fund data.
 
-Provides :class:`BaseDataLoader` (abstract) and :class:`MfApiDataLoader`
-(default implementation that fetches live data from api.mfapi.in).
+Provides :class:`BaseDataLoader` (abstract), :class:`MfApiDataLoader`
+(default implementation that fetches live data from api.mfapi.in), and
+:class:`IndexCsvDataLoader` (local NSE index CSV exports).
 
 To use a custom data source, subclass :class:`BaseDataLoader`::
 
@@ -23,17 +24,45 @@ To use a custom data source, subclass :class:`BaseDataLoader`::
     sim = Simulator(..., data_loader=CsvDataLoader("/path/to/csvs"))
 """
 
+import contextlib
+import csv
 import importlib.resources as resourcelib
 import json
 import logging
 import os
+import re
 import time
+import uuid
+import weakref
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 import requests
 
 
+# Memoized searchsorted positions for get_lowerbound_date, one dict per
+# index keyed by id() (pandas indexes are not hashable). A finalizer drops
+# an index's dict when it is garbage collected, before its id can be reused.
+_lowerbound_positions = {}
+
+
+def _positions_for(index):
+    """Return the ``{target_date: position}`` memo for ``index``."""
+    index_id = id(index)
+    positions = _lowerbound_positions.get(index_id)
+    if positions is None:
+        positions = _lowerbound_positions[index_id] = {}
+        weakref.finalize(index, _lowerbound_positions.pop, index_id, None)
+    return positions
+
+
 def get_lowerbound_date(dates, target_date):
     """Find the earliest date in a DataFrame's index that is >= ``target_date``.
 
@@ -41,6 +70,11 @@ def get_lowerbound_date(dates, target_date):
     day. For example, if you request Jan 1 (a holiday), this returns the
     first trading day after Jan 1.
 
+    For ascending indexes the lookup is a binary search whose result is
+    memoized per ``(index, target_date)``, so repeated snaps against the
+    same NAV series (e.g. every rebalance in a parameter sweep) are a
+    cache hit. Unsorted indexes fall back to a linear scan.
+
     Args:
         dates: A DataFrame with a DatetimeIndex (typically NAV data).
         target_date: The date to search from.
@@ -49,7 +83,61 @@ def get_lowerbound_date(dates, target_date):
         The earliest date in the index that is on or after ``target_date``.
         Returns ``NaT`` if no such date exists.
     """
-    return dates[dates.index >= target_date].index.min()
+    index = dates.index
+    if not index.is_monotonic_increasing:
+        return index[index >= target_date].min()
+    target_date = pd.Timestamp(target_date)
+    positions = _positions_for(index)
+    pos = positions.get(target_date)
+    if pos is None:
+        pos = positions[target_date] = int(index.searchsorted(target_date, side="left"))
+    if pos >= len(index):
+        return pd.NaT
+    return index[pos]
+
+
+def _read_arrow(path, metadata=None):
+    """Read a DataFrame from a memory-mapped Arrow IPC file.
+
+    The file is uncompressed, so numeric columns are handed to pandas
+    as views into the mapped pages rather than decoded copies. Those
+    views are read-only: copy a column before writing into it in place.
+
+    If ``metadata`` is given, returns ``None`` unless the file's schema
+    metadata contains every one of its key/value pairs.
+    """
+    with pa.memory_map(path, "r") as source:
+        reader = pa.ipc.open_file(source)
+        if metadata:
+            stored = reader.schema.metadata or {}
+            if any(stored.get(key) != value for key, value in metadata.items()):
+                return None
+        table = reader.read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+def _write_arrow(path, df, metadata=None):
+    """Write a DataFrame (without its index) to an Arrow IPC file.
+
+    The table is written to a temporary file in the same directory and
+    then renamed over ``path``. Frames still mapped from the previous file
+    by :func:`_read_arrow` keep that file's pages; truncating it in place
+    would leave them pointing past the end of the file. ``metadata``
+    (``bytes`` keys and values) is added to the schema metadata.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if metadata:
+        table = table.replace_schema_metadata({**table.schema.metadata, **metadata})
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
 
 
 class BaseDataLoader(ABC):
@@ -64,6 +152,8 @@ class BaseDataLoader(ABC):
     - ``nav`` — float, the Net Asset Value for that date.
 
     Additional columns are allowed and will be ignored by the simulator.
+    A frame already indexed by a ``DatetimeIndex`` (with no ``date``
+    column) is also accepted and used without re-indexing.
 
     Optionally override :meth:`get_expense_ratio` and :meth:`get_exit_load`
     to provide fund-level cost data for reporting purposes.
@@ -193,8 +283,8 @@ class MfApiDataLoader(BaseDataLoader):
             raise FileNotFoundError(f"Error loading fund list: {e}")
 
     def _get_cache_path(self, scheme_code):
-        """Return the parquet cache file path for a given scheme code."""
-        return os.path.join(self.cache_dir, f"{scheme_code}.parquet")
+        """Return the Arrow IPC cache file path for a given scheme code."""
+        return os.path.join(self.cache_dir, f"{scheme_code}.arrow")
 
     def _is_cache_valid(self, cache_path):
         """Check if a cache file exists and is within the TTL window."""
@@ -204,27 +294,35 @@ class MfApiDataLoader(BaseDataLoader):
         return file_age_hours < self.cache_ttl_hours
 
     def _read_cache(self, cache_path):
-        """Read a cached NAV DataFrame from a parquet file."""
-        return pd.read_parquet(cache_path)
+        """Read a cached NAV DataFrame from a memory-mapped Arrow IPC file."""
+        return _read_arrow(cache_path)
 
     def _write_cache(self, cache_path, df):
-        """Write a NAV DataFrame to a parquet cache file."""
-        df.to_parquet(cache_path, index=False)
+        """Write a NAV DataFrame to an Arrow IPC cache file."""
+        _write_arrow(cache_path, df)
 
     def load_nav_data(self, fund_name) -> pd.DataFrame:
-        """Fetch historical NAV data for a fund, using a local parquet cache.
+        """Fetch historical NAV data for a fund, using a local Arrow cache.
 
         Looks up the fund's scheme code from ``mf_list.json``, checks for
-        a valid cached parquet file under ``self.cache_dir``, and returns
+        a valid cached Arrow IPC file under ``self.cache_dir``, and returns
         it if found. Otherwise fetches the full NAV history from
         ``api.mfapi.in`` and writes it to the cache for next time.
 
+        When a stale cache exists, only rows newer than the last cached
+        date are parsed and merged in. If the API has nothing new, the
+        cache's mtime is refreshed and the cached frame is returned as-is.
+        A cache file that cannot be read is deleted and the full history
+        is fetched again.
+
         Args:
             fund_name: Exact scheme name as it appears in ``mf_list.json``.
 
         Returns:
             DataFrame with ``date`` (datetime64) and ``nav`` (float)
-            columns.
+            columns. Frames served from the cache are backed by read-only
+            memory-mapped arrays, while freshly fetched ones are writable;
+            copy a column before modifying it in place.
 
         Raises:
             FileNotFoundError: If the fund name is not found or the
@@ -235,17 +333,42 @@ class MfApiDataLoader(BaseDataLoader):
             scheme_code = fund_row["schemeCode"].tolist()[0]
             cache_path = self._get_cache_path(scheme_code)
 
-            if self._is_cache_valid(cache_path):
-                self.logger.info(f"Loading cached NAV data for {fund_name}")
-                return self._read_cache(cache_path)
+            cached_df = None
+            if os.path.exists(cache_path):
+                try:
+                    cached_df = self._read_cache(cache_path)
+                except (OSError, pa.ArrowException) as e:
+                    # A truncated or corrupt cache is dropped and refetched in full.
+                    self.logger.warning(f"Discarding unreadable NAV cache {cache_path}: {e}")
+                    with contextlib.suppress(OSError):
+                        os.remove(cache_path)
+                else:
+                    if self._is_cache_valid(cache_path):
+                        self.logger.info(f"Loading cached NAV data for {fund_name}")
+                        return cached_df
 
             # Fetch from API
             url = f"http://api.mfapi.in/mf/{scheme_code}"
             response = requests.get(url)
             json_data = response.json()
-            fund_df = pd.DataFrame.from_records(json_data["data"])
+            records = json_data["data"]
+
+            # Stale cache: keep only rows the cache doesn't have yet
+            if cached_df is not None and not cached_df.empty:
+                dates = pd.to_datetime([r["date"] for r in records], format="%d-%m-%Y")
+                is_new = dates > cached_df["date"].max()
+                if not is_new.any():
+                    os.utime(cache_path, None)
+                    self.logger.info(f"Cached NAV data for {fund_name} is up to date")
+                    return cached_df
+                records = [r for r, new in zip(records, is_new) if new]
+
+            fund_df = pd.DataFrame.from_records(records)
             fund_df["date"] = pd.to_datetime(fund_df["date"], format="%d-%m-%Y")
             fund_df["nav"] = fund_df["nav"].astype(float)
+            if cached_df is not None:
+                # The API lists newest NAVs first, so new rows go on top.
+                fund_df = pd.concat([fund_df, cached_df], ignore_index=True)
 
             # Write to cache
             self._write_cache(cache_path, fund_df)
@@ -254,3 +377,291 @@ class MfApiDataLoader(BaseDataLoader):
             return fund_df
         except Exception as e:
             raise FileNotFoundError(f"Error loading NAV data for {fund_name}: {e}")
+
+
+_NSE_FILENAME_RE = re.compile(r"(.*?)_Historical_PR_.*\.csv")
+
+
+@lru_cache(maxsize=4096)
+def _index_name_for_file(fname):
+    """Map an NSE export filename to its index key, or ``None`` if it isn't one.
+
+    ``"NIFTY 50_Historical_PR_01012020to06012020.csv"`` -> ``"NIFTY_50"``.
+    Memoized so rescanning the same directory skips the regex entirely.
+    """
+    match = _NSE_FILENAME_RE.match(fname)
+    if match is None:
+        return None
+    return match.group(1).strip().replace(" ", "_").replace("-", "_")
+
+
+# Names NSE uses for the closing index level across its export formats.
+_NSE_CLOSE_COLUMNS = ("Close", "Closing Index Value")
+
+# Placeholders NSE writes for missing values (e.g. a close on a holiday row).
+_NSE_NA_VALUES = ("-", "")
+
+# Date formats seen in NSE exports, most common first.
+_NSE_DATE_FORMATS = ("%d-%b-%Y", "%d %b %Y", "%d-%m-%Y")
+
+
+def _parse_nse_dates(values):
+    """Parse NSE date strings, trying each known format on what is still unparsed.
+
+    An explicit ``format`` takes pandas' vectorized strptime path; format
+    inference falls back to per-element ``dateutil`` parsing, which is
+    far slower. A format is only taken as final once every non-null value
+    has parsed, so a file mixing formats is not half turned into ``NaT``.
+    Whatever no known format matches goes through day-first inference;
+    values that still fail to parse come back as ``NaT``.
+    """
+    values = pd.Series(values)
+    dates = pd.to_datetime(values, format=_NSE_DATE_FORMATS[0], errors="coerce", cache=True)
+    for fmt in _NSE_DATE_FORMATS[1:] + (None,):
+        missing = dates.isna() & values.notna()
+        if not missing.any():
+            break
+        if fmt is None:
+            parsed = pd.to_datetime(values[missing], dayfirst=True, errors="coerce")
+        else:
+            parsed = pd.to_datetime(values[missing], format=fmt, errors="coerce", cache=True)
+        dates[missing] = parsed
+    return dates
+
+
+def _is_nse_column(name):
+    return "date" in name.lower() or name.strip() in _NSE_CLOSE_COLUMNS
+
+
+# Stamped into each ``.csv.arrow`` sidecar. Bump the version whenever
+# IndexCsvDataLoader._parse_csv changes what it produces, so sidecars written
+# by older parse logic are re-parsed instead of reused.
+_NSE_SIDECAR_METADATA = {b"mfsim.nse_sidecar_version": b"1"}
+
+
+# Exports larger than this are streamed batch by batch, so the raw close
+# strings for the whole file are never held in memory at once.
+_NSE_STREAM_THRESHOLD = 50 * 1024 * 1024
+
+
+def _nse_close_to_float(data):
+    """Cast the close column of an Arrow table/batch from strings to ``float64``."""
+    for i, name in enumerate(data.column_names):
+        if name.strip() in _NSE_CLOSE_COLUMNS:
+            close = pc.cast(pc.replace_substring(data.column(i), ",", ""), pa.float64())
+            data = data.set_column(i, name, close)
+    return data
+
+
+def _read_nse_csv(path):
+    """Read the date and closing-value columns of an NSE export.
+
+    Uses pyarrow's multi-threaded CSV reader, converting only the needed
+    columns. Both are read as strings: dates are left to
+    :func:`_parse_nse_dates`, and quoted closes such as ``"12,345.60"`` are
+    cast to ``float64`` once the separators are stripped; ``"-"``
+    placeholders become NaN (the loader drops those rows). Files above
+    ``_NSE_STREAM_THRESHOLD`` bytes are converted one record batch at a time.
+    Files pyarrow rejects (e.g. ragged rows or unexpected headers) are
+    re-read with the pandas C engine. Column names are returned stripped.
+    """
+    # utf-8-sig drops a leading BOM, which pyarrow also skips.
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f), [])
+    # A repeated header name is requested once; pyarrow then keeps its first column.
+    wanted = list(dict.fromkeys(name for name in header if _is_nse_column(name)))
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=wanted,
+        column_types={name: pa.string() for name in wanted},
+        null_values=list(_NSE_NA_VALUES),
+        strings_can_be_null=True,
+    )
+    try:
+        if os.path.getsize(path) > _NSE_STREAM_THRESHOLD:
+            with pa_csv.open_csv(path, convert_options=convert_options) as reader:
+                table = pa.Table.from_batches([_nse_close_to_float(b) for b in reader])
+        else:
+            table = _nse_close_to_float(pa_csv.read_csv(path, convert_options=convert_options))
+    except (pa.ArrowInvalid, KeyError):
+        # KeyError covers pa.ArrowKeyError, e.g. an include_columns name missing.
+        df = pd.read_csv(
+            path,
+            usecols=_is_nse_column,
+            dtype={c: "float64" for c in _NSE_CLOSE_COLUMNS},
+            thousands=",",
+            na_values=list(_NSE_NA_VALUES),
+        )
+        df.columns = df.columns.str.strip()
+        return df
+
+    return table.rename_columns([name.strip() for name in table.column_names]).to_pandas()
+
+
+@dataclass
+class NavSeries:
+    """A NAV history stored as two parallel arrays.
+
+    Attributes:
+        dates: ``datetime64`` array of NAV dates, sorted ascending.
+        navs: ``float64`` array of NAVs aligned with ``dates``.
+    """
+
+    dates: np.ndarray
+    navs: np.ndarray
+
+    @classmethod
+    def from_frame(cls, df):
+        """Build from a DataFrame with ``date`` and ``nav`` columns (sorted)."""
+        return cls(dates=df["date"].to_numpy(), navs=df["nav"].to_numpy(dtype=np.float64))
+
+    def to_frame(self):
+        """Wrap the arrays in a ``date``/``nav`` DataFrame without copying them."""
+        return pd.DataFrame({"date": self.dates, "nav": self.navs}, copy=False)
+
+    def nav_at(self, date):
+        """NAV on the first date on or after ``date``, or NaN past the last date."""
+        pos = np.searchsorted(self.dates, pd.Timestamp(date).to_datetime64(), side="left")
+        if pos >= len(self.navs):
+            return float("nan")
+        return float(self.navs[pos])
+
+
+class IndexCsvDataLoader(BaseDataLoader):
+    """Load index NAV data from local CSV files with *_Historical_PR_* naming.
+
+    Every matching CSV in ``data_dir`` is parsed once at construction and
+    keyed by its index name (e.g. ``NIFTY 50_Historical_PR_...csv`` becomes
+    ``NIFTY_50``). The ``Close`` column is used as the NAV.
+
+    Each index is held as a :class:`NavSeries` (parallel date and NAV
+    arrays). :meth:`load_nav_data` wraps those arrays in a DataFrame
+    without copying them, and :meth:`nav_at` answers point lookups with a
+    binary search on the raw arrays. Callers may add, replace or reindex
+    columns freely; pandas Copy-on-Write (always on from pandas 3.0, which
+    mfsim requires) keeps in-place writes from reaching the loader.
+
+    Parsed files are cached in an Arrow IPC sidecar next to each CSV
+    (``<name>.csv.arrow``). The sidecar is reused while it is at least as
+    new as its CSV and carries the current parser version, so warm starts
+    skip CSV tokenizing and date parsing.
+    Arrays read from a sidecar are read-only memory-mapped views, whereas
+    those parsed from a CSV are writable.
+
+    Args:
+        data_dir: Directory containing the NSE index CSV exports.
+    """
+
+    def __init__(self, data_dir):
+        super().__init__(data_dir=data_dir)
+        self.data_dir = data_dir
+        self.logger = logging.getLogger(__name__)
+        self.index_data = self._load_all_csvs()
+
+    def _load_all_csvs(self):
+        paths = {}
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                # Cheap suffix check first; only CSVs reach the regex.
+                if not entry.name.endswith(".csv") or not entry.is_file():
+                    continue
+                index_name = _index_name_for_file(entry.name)
+                # scandir order is arbitrary: when several exports map to one
+                # index, keep the lexicographically last (usually newest range).
+                if index_name is not None and entry.path > paths.get(index_name, ""):
+                    paths[index_name] = entry.path
+        if not paths:
+            return {}
+
+        # CSV parsing and Arrow reads are mostly GIL-free C code, so files
+        # load concurrently on threads.
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            futures = {name: executor.submit(self._load_csv, path) for name, path in paths.items()}
+        loaded = {name: future.result() for name, future in futures.items()}
+        return {name: series for name, series in loaded.items() if series is not None}
+
+    def _load_csv(self, path):
+        """Return the CSV at ``path`` as a :class:`NavSeries`, or ``None`` if unusable.
+
+        Reads the Arrow sidecar when it is fresh and was written by the
+        current parser version; otherwise parses the CSV and refreshes the
+        sidecar.
+        """
+        cache_path = path + ".arrow"
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            df = _read_arrow(cache_path, metadata=_NSE_SIDECAR_METADATA)
+            if df is not None:
+                return NavSeries.from_frame(df)
+        df = self._parse_csv(path)
+        if not {"date", "nav"} <= set(df.columns):
+            self.logger.warning(f"Skipping {path}: no date and close columns found")
+            return None
+        try:
+            _write_arrow(cache_path, df, metadata=_NSE_SIDECAR_METADATA)
+        except OSError as e:
+            self.logger.warning(f"Could not write CSV cache {cache_path}: {e}")
+        return NavSeries.from_frame(df)
+
+    def _parse_csv(self, path):
+        """Parse one NSE index CSV into a frame with ``date`` and ``nav`` columns.
+
+        Only the date and closing-value columns are kept; see
+        :func:`_read_nse_csv`.
+        """
+        df = _read_nse_csv(path)
+        # Standardize column names
+        for col in df.columns:
+            if "date" in col.lower():
+                if col != "date":
+                    df.rename(columns={col: "date"}, inplace=True)
+                break
+        df.rename(columns={c: "nav" for c in _NSE_CLOSE_COLUMNS}, inplace=True)
+        if "date" in df.columns:
+            df["date"] = _parse_nse_dates(df["date"])
+            unparsed = df["date"].isna()
+            if unparsed.any():
+                self.logger.warning(
+                    f"Dropping {int(unparsed.sum())} row(s) with unparseable dates from {path}"
+                )
+                df = df[~unparsed]
+        if "date" in df.columns and "nav" in df.columns:
+            df = df[["date", "nav"]]
+            # NSE exports are already ordered (usually newest first), so a
+            # reversal is enough; only fully sort a genuinely unordered file.
+            if df["date"].is_monotonic_decreasing:
+                df = df.iloc[::-1]
+            elif not df["date"].is_monotonic_increasing:
+                df = df.sort_values("date")
+            df["nav"] = df["nav"].astype(float)
+            # "-" placeholder closes can't be traded at; keep them out of the series.
+            missing = df["nav"].isna()
+            if missing.any():
+                self.logger.warning(
+                    f"Dropping {int(missing.sum())} row(s) with no closing value from {path}"
+                )
+                df = df[~missing]
+            df = df.reset_index(drop=True)
+        return df
+
+    def _series(self, fund_name):
+        key = fund_name.replace(" ", "_")
+        if key not in self.index_data:
+            raise ValueError(
+                f"Index '{fund_name}' not found. Available: {list(self.index_data.keys())}"
+            )
+        return self.index_data[key]
+
+    def load_nav_data(self, fund_name):
+        return self._series(fund_name).to_frame()
+
+    def nav_at(self, fund_name, date):
+        """Return the index level on the first trading day on or after ``date``.
+
+        Args:
+            fund_name: Index name, as accepted by :meth:`load_nav_data`.
+            date: Date to look up.
+
+        Returns:
+            The closing level as a float, or NaN if ``date`` is after the
+            last available date.
+        """
+        return self._series(fund_name).nav_at(date)
@@ -31,8 +31,8 @@ def setup_logger(name="backtester", log_dir="logs"):
           metric calculations). File is named
           ``{name}_{YYYYMMDD_HHMMSS}.log``.
     """
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    # exist_ok: parallel test workers may all create the directory at once.
+    os.makedirs(log_dir, exist_ok=True)
 
     logger = logging.getLogger(name)
 
@@ -0,0 +1,98 @@
+"""Test doubles and synthetic NAV data shared across the mfsim test suite.
+
+Fixtures live in ``conftest.py``; the classes and constants they are built
+from live here so test modules can import them directly.
+"""
+
+import numpy as np
+import pandas as pd
+
+from mfsim.strategies.base_strategy import BaseStrategy
+from mfsim.utils.data_loader import BaseDataLoader
+
+# ---------------------------------------------------------------------------
+# Mock helpers
+# ---------------------------------------------------------------------------
+
+
+class MockDataLoader(BaseDataLoader):
+    """Data loader backed by in-memory dicts for testing.
+
+    Expects *nav_data_dict* to map fund names to DataFrames in any shape
+    ``Simulator._load_all_nav_data()`` accepts: a ``date`` column formatted
+    as ``"DD-MM-YYYY"`` strings plus a ``nav`` column, exactly as the real
+    loaders return them, or frames already indexed by a ``DatetimeIndex``.
+    """
+
+    def __init__(self, nav_data_dict):
+        # Deliberately skip super().__init__() to avoid file system access.
+        self.nav_data_dict = nav_data_dict
+
+    def load_nav_data(self, fund_name):
+        if fund_name not in self.nav_data_dict:
+            raise FileNotFoundError(f"Fund not found: {fund_name}")
+        return self.nav_data_dict[fund_name].copy(deep=False)
+
+    def get_expense_ratio(self, fund_name):
+        return 0
+
+    def get_exit_load(self, fund_name):
+        return 0
+
+
+class BuyAndHoldStrategy(BaseStrategy):
+    """Strategy that allocates once and never rebalances.  For testing."""
+
+    def __init__(self, fund_list, allocation=None, metrics=None):
+        super().__init__(
+            frequency="annually",
+            metrics=metrics or ["Total Return", "XIRR"],
+            fund_list=fund_list,
+        )
+        self.allocation = allocation
+
+    def allocate_money(self, money_invested, nav_data, current_date):
+        if self.allocation:
+            return {f: money_invested * p for f, p in self.allocation.items()}
+        n = len(self.fund_list)
+        return {f: money_invested / n for f in self.fund_list}
+
+    def rebalance(self, portfolio, nav_data, current_date):
+        return []
+
+
+# ---------------------------------------------------------------------------
+# NAV data factory
+# ---------------------------------------------------------------------------
+
+
+def make_nav_df(start_date, num_days, start_nav=100.0, daily_return=0.0003):
+    """Generate synthetic NAV data with consistent daily returns.
+
+    Returns a DataFrame with columns ``date`` (string, DD-MM-YYYY format)
+    and ``nav`` (float), which is the format expected by the real data
+    loader pipeline (``Simulator._load_all_nav_data`` will parse it).
+
+    Parameters
+    ----------
+    start_date : str
+        Start date, e.g. ``"2020-01-01"``.
+    num_days : int
+        Number of business days to generate.
+    start_nav : float
+        NAV on the first day.
+    daily_return : float
+        Constant daily return (e.g. 0.0003 => 0.03 % / day).
+    """
+    dates = pd.bdate_range(start=start_date, periods=num_days)
+    factors = np.full(num_days, 1.0 + daily_return)
+    factors[0] = 1.0
+    navs = start_nav * np.cumprod(factors)
+    return pd.DataFrame({"date": dates.strftime("%d-%m-%Y"), "nav": navs})
+
+
+# ---------------------------------------------------------------------------
+# Metric data: one fund over one year (252 business days)
+# ---------------------------------------------------------------------------
+
+METRIC_DATES = pd.bdate_range("2020-01-01", periods=252, name="date")
@@ -1,126 +1,157 @@
 """Shared fixtures for the mfsim test suite.
 
 Provides mock data loaders, a simple buy-and-hold strategy, and synthetic NAV
-data generators so that no test ever hits a real API or the file system.
+data (built from the helpers in ``tests/_data.py``) so that no test ever hits
+a real API or the file system.
 """
 
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 import pytest
 
-from mfsim.strategies.base_strategy import BaseStrategy
-from mfsim.utils.data_loader import BaseDataLoader
+from mfsim.backtester.simulator import Simulator
+from tests._data import METRIC_DATES, BuyAndHoldStrategy, MockDataLoader, make_nav_df
 
 # ---------------------------------------------------------------------------
-# Mock helpers
+# Fixtures
 # ---------------------------------------------------------------------------
 
 
-class MockDataLoader(BaseDataLoader):
-    """Data loader backed by in-memory dicts for testing.
+@pytest.fixture(scope="session")
+def simple_nav_data():
+    """Two funds with ~2 years of synthetic business-day NAV data.
 
-    Expects *nav_data_dict* to map fund names to DataFrames that have a
-    ``date`` column formatted as ``"DD-MM-YYYY"`` strings and a ``nav``
-    column, exactly as the real ``Simulator._load_all_nav_data()`` expects
-    before it parses the dates and sets the index.
+    Session-scoped: treat the frames as read-only (``.copy()`` before
+    mutating them in a test).
     """
+    return {
+        "Fund A": make_nav_df("2020-01-01", 504, start_nav=100.0, daily_return=0.0004),
+        "Fund B": make_nav_df("2020-01-01", 504, start_nav=50.0, daily_return=0.0002),
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_loader(simple_nav_data):
+    """``MockDataLoader`` serving the ``simple_nav_data`` funds.
+
+    The frames are parsed and date-indexed once here, so the many
+    simulators built from this loader skip date parsing entirely
+    (``TestNavFramePreparation`` covers the string-date path).
 
-    def __init__(self, nav_data_dict):
-        # Deliberately skip super().__init__() to avoid file system access.
-        self.nav_data_dict = nav_data_dict
+    Session-scoped: ``load_nav_data`` returns a fresh shallow copy each
+    call, so callers cannot alter the shared frames.
+    """
+    return MockDataLoader(
+        {
+            fund: df.assign(date=pd.to_datetime(df["date"], format="%d-%m-%Y")).set_index("date")
+            for fund, df in simple_nav_data.items()
+        }
+    )
 
-    def load_nav_data(self, fund_name):
-        if fund_name not in self.nav_data_dict:
-            raise FileNotFoundError(f"Fund not found: {fund_name}")
-        return self.nav_data_dict[fund_name].copy()
 
-    def get_expense_ratio(self, fund_name):
-        return 0
+# ---------------------------------------------------------------------------
+# Metric fixtures: one fund over one year (252 business days)
+# ---------------------------------------------------------------------------
 
-    def get_exit_load(self, fund_name):
-        return 0
 
+def _single_fund_nav_data(navs):
+    """``{"Fund A": DataFrame}`` with ``navs`` on ``METRIC_DATES``."""
+    return {"Fund A": pd.DataFrame({"nav": navs}, index=METRIC_DATES)}
 
-class BuyAndHoldStrategy(BaseStrategy):
-    """Strategy that allocates once and never rebalances.  For testing."""
 
-    def __init__(self, fund_list, allocation=None, metrics=None):
-        super().__init__(
-            frequency="annually",
-            metrics=metrics or ["Total Return", "XIRR"],
-            fund_list=fund_list,
-        )
-        self.allocation = allocation
+@pytest.fixture(scope="session")
+def nav_252_geometric():
+    """Factory: NAV data starting at 100 and growing by ``growth`` per day.
 
-    def allocate_money(self, money_invested, nav_data, current_date):
-        if self.allocation:
-            return {f: money_invested * p for f, p in self.allocation.items()}
-        n = len(self.fund_list)
-        return {f: money_invested / n for f in self.fund_list}
+    Frames are built once per growth factor and shared; treat as read-only.
+    """
 
-    def rebalance(self, portfolio, nav_data, current_date):
-        return []
+    @lru_cache
+    def build(growth):
+        return _single_fund_nav_data(100.0 * np.power(growth, np.arange(252)))
 
+    return build
 
-# ---------------------------------------------------------------------------
-# NAV data factory
-# ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="session")
+def nav_252_random_normal():
+    """NAV data driven by seeded normal daily returns (mean 0.1%, sd 0.5%)."""
+    daily_returns = np.random.default_rng(42).normal(0.001, 0.005, 252)
+    factors = 1.0 + daily_returns
+    factors[0] = 1.0  # the series starts at 100 on the first day
+    return _single_fund_nav_data(100.0 * np.cumprod(factors))
 
-def make_nav_df(start_date, num_days, start_nav=100.0, daily_return=0.0003):
-    """Generate synthetic NAV data with consistent daily returns.
 
-    Returns a DataFrame with columns ``date`` (string, DD-MM-YYYY format)
-    and ``nav`` (float), which is the format expected by the real data
-    loader pipeline (``Simulator._load_all_nav_data`` will parse it).
+@pytest.fixture(scope="session")
+def single_fund_history_10000():
+    """100 units of Fund A bought for 10,000 on the first of ``METRIC_DATES``.
 
-    Parameters
-    ----------
-    start_date : str
-        Start date, e.g. ``"2020-01-01"``.
-    num_days : int
-        Number of business days to generate.
-    start_nav : float
-        NAV on the first day.
-    daily_return : float
-        Constant daily return (e.g. 0.0003 => 0.03 % / day).
+    Returns ``(portfolio_history, current_portfolio, end_date)``.
     """
-    dates = pd.bdate_range(start=start_date, periods=num_days)
-    navs = [start_nav]
-    for _ in range(1, num_days):
-        navs.append(navs[-1] * (1 + daily_return))
-    df = pd.DataFrame(
-        {
-            "date": [d.strftime("%d-%m-%Y") for d in dates],
-            "nav": navs,
-        }
+    portfolio_history = pd.DataFrame(
+        {"fund_name": ["Fund A"], "units": [100.0], "amount": [10000.0]},
+        index=METRIC_DATES[:1],
+    )
+    return portfolio_history, {"Fund A": 100.0}, METRIC_DATES[-1]
+
+
+@pytest.fixture(scope="session")
+def buy_hold_strategy():
+    """60 / 40 buy-and-hold strategy over Fund A and Fund B.
+
+    Session-scoped: the strategy keeps no per-run state, so every
+    ``Simulator`` can share one instance.
+    """
+    return BuyAndHoldStrategy(
+        fund_list=["Fund A", "Fund B"],
+        allocation={"Fund A": 0.6, "Fund B": 0.4},
     )
-    return df
 
 
 # ---------------------------------------------------------------------------
-# Fixtures
+# Completed simulations
+#
+# Each runs once per module and is shared by every test that only reads
+# from it. Tests that mutate a simulator must build their own.
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def simple_nav_data():
-    """Two funds with ~2 years of synthetic business-day NAV data."""
-    return {
-        "Fund A": make_nav_df("2020-01-01", 504, start_nav=100.0, daily_return=0.0004),
-        "Fund B": make_nav_df("2020-01-01", 504, start_nav=50.0, daily_return=0.0002),
-    }
+def _completed_sim(loader, strategy, end_date, sip_amount=0, sip_frequency="monthly"):
+    """Run a 100,000 buy-and-hold from 2020-01-02 to ``end_date``."""
+    sim = Simulator(
+        start_date="2020-01-02",
+        end_date=end_date,
+        initial_investment=100000,
+        strategy=strategy,
+        sip_amount=sip_amount,
+        sip_frequency=sip_frequency,
+        data_loader=loader,
+    )
+    sim.run()
+    return sim
 
 
-@pytest.fixture
-def mock_loader(simple_nav_data):
-    """``MockDataLoader`` seeded with the ``simple_nav_data`` fixture."""
-    return MockDataLoader(simple_nav_data)
+@pytest.fixture(scope="module")
+def full_year_sim(mock_loader, buy_hold_strategy):
+    """Lump sum held through 2020; results are in ``sim.metrics_results``."""
+    return _completed_sim(mock_loader, buy_hold_strategy, "2020-12-31")
 
 
-@pytest.fixture
-def buy_hold_strategy():
-    """60 / 40 buy-and-hold strategy over Fund A and Fund B."""
-    return BuyAndHoldStrategy(
-        fund_list=["Fund A", "Fund B"],
-        allocation={"Fund A": 0.6, "Fund B": 0.4},
-    )
+@pytest.fixture(scope="module")
+def one_month_sim(mock_loader, buy_hold_strategy):
+    """Lump sum held until 2020-02-01, no SIP."""
+    return _completed_sim(mock_loader, buy_hold_strategy, "2020-02-01")
+
+
+@pytest.fixture(scope="module")
+def half_year_sim(mock_loader, buy_hold_strategy):
+    """Lump sum held until 2020-06-30, no SIP."""
+    return _completed_sim(mock_loader, buy_hold_strategy, "2020-06-30")
+
+
+@pytest.fixture(scope="module")
+def half_year_sip_sim(mock_loader, buy_hold_strategy):
+    """Lump sum plus a 10,000 monthly SIP until 2020-06-30."""
+    return _completed_sim(mock_loader, buy_hold_strategy, "2020-06-30", sip_amount=10000)
@@ -1,53 +1,100 @@
 """Tests for data-loader contracts and the ``get_lowerbound_date`` helper.
 
-All tests use the ``MockDataLoader`` from conftest -- no real API calls.
+All tests use the ``MockDataLoader`` from conftest or a monkeypatched
+``requests.get`` -- no real API calls.
 """
 
+import gc
+import math
+import os
+import subprocess
+import sys
+import textwrap
+import time
+from functools import lru_cache
+from types import SimpleNamespace
+
 import pandas as pd
 import pytest
+import requests
 
-from mfsim.utils.data_loader import get_lowerbound_date
+from mfsim.utils import data_loader
+from mfsim.utils.data_loader import IndexCsvDataLoader, MfApiDataLoader, get_lowerbound_date
 
 # ---------------------------------------------------------------------------
 # get_lowerbound_date
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=64)
+def _make_df(dates):
+    """Return a DataFrame with a DatetimeIndex (like parsed NAV data).
+
+    Cached per ``dates`` tuple, so callers must treat the result as read-only.
+    """
+    idx = pd.to_datetime(list(dates))
+    return pd.DataFrame({"nav": range(len(idx))}, index=idx)
+
+
 class TestGetLowerboundDate:
     """Tests for the forward-snapping date lookup used by the Simulator."""
 
-    def _make_df(self, dates):
-        """Return a DataFrame with a DatetimeIndex (like parsed NAV data)."""
-        idx = pd.to_datetime(dates)
-        return pd.DataFrame({"nav": range(len(idx))}, index=idx)
-
     def test_exact_match(self):
-        df = self._make_df(["2020-01-01", "2020-01-02", "2020-01-03"])
+        df = _make_df(("2020-01-01", "2020-01-02", "2020-01-03"))
         result = get_lowerbound_date(df, pd.Timestamp("2020-01-02"))
         assert result == pd.Timestamp("2020-01-02")
 
     def test_first_date(self):
-        df = self._make_df(["2020-01-01", "2020-01-02", "2020-01-03"])
+        df = _make_df(("2020-01-01", "2020-01-02", "2020-01-03"))
         result = get_lowerbound_date(df, pd.Timestamp("2020-01-01"))
         assert result == pd.Timestamp("2020-01-01")
 
     def test_snaps_forward_to_next_available(self):
         """If the target date is a gap, snap forward to the next date."""
         # Only Mon/Wed/Fri data
-        df = self._make_df(["2020-01-06", "2020-01-08", "2020-01-10"])
+        df = _make_df(("2020-01-06", "2020-01-08", "2020-01-10"))
         result = get_lowerbound_date(df, pd.Timestamp("2020-01-07"))
         assert result == pd.Timestamp("2020-01-08")
 
     def test_past_end_returns_nat(self):
-        df = self._make_df(["2020-01-01", "2020-01-02", "2020-01-03"])
+        df = _make_df(("2020-01-01", "2020-01-02", "2020-01-03"))
         result = get_lowerbound_date(df, pd.Timestamp("2020-02-01"))
         assert pd.isna(result)
 
     def test_before_start(self):
-        df = self._make_df(["2020-01-05", "2020-01-06", "2020-01-07"])
+        df = _make_df(("2020-01-05", "2020-01-06", "2020-01-07"))
         result = get_lowerbound_date(df, pd.Timestamp("2020-01-01"))
         assert result == pd.Timestamp("2020-01-05")
 
+    def test_descending_index(self):
+        """Unsorted (e.g. newest-first API) indexes still snap forward."""
+        df = _make_df(("2020-01-10", "2020-01-08", "2020-01-06"))
+        result = get_lowerbound_date(df, pd.Timestamp("2020-01-07"))
+        assert result == pd.Timestamp("2020-01-08")
+
+    def test_repeated_lookups_are_independent_per_frame(self):
+        """Cached positions must not leak between different NAV frames."""
+        df1 = _make_df(("2020-01-06", "2020-01-08", "2020-01-10"))
+        df2 = _make_df(("2020-01-07", "2020-01-09"))
+        target = pd.Timestamp("2020-01-07")
+        assert get_lowerbound_date(df1, target) == pd.Timestamp("2020-01-08")
+        assert get_lowerbound_date(df2, target) == pd.Timestamp("2020-01-07")
+        assert get_lowerbound_date(df1, target) == pd.Timestamp("2020-01-08")
+
+    def test_collected_index_drops_only_its_positions(self):
+        target = pd.Timestamp("2020-01-07")
+        keep = pd.DataFrame({"nav": [1.0, 2.0]}, index=pd.to_datetime(["2020-01-06", "2020-01-08"]))
+        drop = pd.DataFrame({"nav": [1.0, 2.0]}, index=pd.to_datetime(["2020-01-07", "2020-01-09"]))
+        get_lowerbound_date(keep, target)
+        get_lowerbound_date(drop, target)
+        drop_id = id(drop.index)
+
+        del drop
+        gc.collect()
+
+        assert drop_id not in data_loader._lowerbound_positions
+        assert data_loader._lowerbound_positions[id(keep.index)] == {target: 1}
+
 
 # ---------------------------------------------------------------------------
 # MockDataLoader contract tests
@@ -57,7 +104,7 @@ class TestGetLowerboundDate:
 class TestMockDataLoader:
     def test_load_nav_data_returns_correct_columns(self, mock_loader):
         df = mock_loader.load_nav_data("Fund A")
-        assert "date" in df.columns
+        assert df.index.name == "date"
         assert "nav" in df.columns
         assert len(df) > 0
 
@@ -72,17 +119,21 @@ class TestMockDataLoader:
         assert mock_loader.get_exit_load("Fund A") == 0
 
     def test_load_returns_copy(self, mock_loader):
-        """Loading should return a copy so mutations don't leak."""
+        """Loading should return a distinct object so mutations don't leak."""
         df1 = mock_loader.load_nav_data("Fund A")
         df2 = mock_loader.load_nav_data("Fund A")
         df1.drop(df1.index, inplace=True)
-        assert len(df2) > 0  # df2 should be unaffected
+        df2["nav"] = 0.0
+        df3 = mock_loader.load_nav_data("Fund A")
+        assert len(df3) > 0  # neither mutation should reach the loader
+        assert (df3["nav"] > 0).all()
 
     def test_nav_data_types(self, mock_loader):
-        """nav column should be numeric and date column should be string."""
+        """nav column should be numeric and dates pre-parsed into a sorted index."""
         df = mock_loader.load_nav_data("Fund A")
         assert pd.api.types.is_numeric_dtype(df["nav"])
-        assert pd.api.types.is_string_dtype(df["date"])
+        assert isinstance(df.index, pd.DatetimeIndex)
+        assert df.index.is_monotonic_increasing
 
     def test_both_funds_available(self, mock_loader):
         """Both Fund A and Fund B should be loadable."""
@@ -90,3 +141,307 @@ class TestMockDataLoader:
         df_b = mock_loader.load_nav_data("Fund B")
         assert len(df_a) > 0
         assert len(df_b) > 0
+
+
+# ---------------------------------------------------------------------------
+# MfApiDataLoader cache
+# ---------------------------------------------------------------------------
+
+
+class TestMfApiDataLoaderCache:
+    def test_cache_round_trip(self, tmp_path, simple_nav_data):
+        """NAV frames written to the Arrow cache should read back unchanged."""
+        loader = MfApiDataLoader(cache_dir=str(tmp_path))
+        df = simple_nav_data["Fund A"].copy()
+        df["date"] = pd.to_datetime(df["date"], format="%d-%m-%Y")
+
+        cache_path = loader._get_cache_path(12345)
+        loader._write_cache(cache_path, df)
+
+        assert loader._is_cache_valid(cache_path)
+        pd.testing.assert_frame_equal(loader._read_cache(cache_path), df)
+
+    def test_rewrite_keeps_previously_read_frames_valid(self, tmp_path):
+        """Rewriting a cache must not pull pages out from under mapped frames.
+
+        Runs in a subprocess: touching a truncated mapping is a SIGBUS, which
+        would otherwise take the whole test session down with it.
+        """
+        script = textwrap.dedent(
+            f"""
+            import numpy as np
+            import pandas as pd
+            from mfsim.utils.data_loader import _read_arrow, _write_arrow
+
+            path = {str(tmp_path / "nav.arrow")!r}
+            n = 100_000
+            dates = pd.date_range("2000-01-01", periods=n)
+            df = pd.DataFrame({{"date": dates, "nav": np.arange(n, dtype=float)}})
+            _write_arrow(path, df)
+            old = _read_arrow(path)
+            _write_arrow(path, df.iloc[:10])
+            assert old["nav"].sum() == df["nav"].sum()
+            assert old["date"].iloc[-1] == df["date"].iloc[-1]
+            assert len(_read_arrow(path)) == 10
+            """
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", script], cwd=repo_root, capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+        assert [p.name for p in tmp_path.iterdir()] == ["nav.arrow"]  # no temp files left
+
+    def _stale_loader(self, tmp_path, rows):
+        """Loader whose cache for the first listed scheme holds ``rows`` and is past its TTL."""
+        loader = MfApiDataLoader(cache_dir=str(tmp_path))
+        fund_name = loader.funds_list_df["schemeName"].iloc[0]
+        scheme_code = loader.funds_list_df["schemeCode"].iloc[0]
+        cached = pd.DataFrame(
+            {
+                "date": pd.to_datetime([r["date"] for r in rows], format="%d-%m-%Y"),
+                "nav": [float(r["nav"]) for r in rows],
+            }
+        )
+        cache_path = loader._get_cache_path(scheme_code)
+        loader._write_cache(cache_path, cached)
+        os.utime(cache_path, (0, 0))
+        return loader, fund_name, cache_path
+
+    def _mock_api(self, monkeypatch, rows):
+        response = SimpleNamespace(json=lambda: {"data": rows})
+        monkeypatch.setattr(requests, "get", lambda url: response)
+
+    def test_stale_cache_merges_only_new_rows(self, tmp_path, monkeypatch):
+        old_rows = [{"date": "03-01-2020", "nav": "11.0"}, {"date": "02-01-2020", "nav": "10.0"}]
+        loader, fund_name, cache_path = self._stale_loader(tmp_path, old_rows)
+        self._mock_api(monkeypatch, [{"date": "06-01-2020", "nav": "12.0"}, *old_rows])
+
+        df = loader.load_nav_data(fund_name)
+
+        assert df["date"].tolist() == list(
+            pd.to_datetime(["2020-01-06", "2020-01-03", "2020-01-02"])
+        )
+        assert df["nav"].tolist() == [12.0, 11.0, 10.0]
+        assert loader._is_cache_valid(cache_path)
+        assert len(loader._read_cache(cache_path)) == 3
+
+    def test_stale_cache_without_new_rows_is_touched(self, tmp_path, monkeypatch):
+        old_rows = [{"date": "03-01-2020", "nav": "11.0"}, {"date": "02-01-2020", "nav": "10.0"}]
+        loader, fund_name, cache_path = self._stale_loader(tmp_path, old_rows)
+        self._mock_api(monkeypatch, old_rows)
+
+        df = loader.load_nav_data(fund_name)
+
+        assert len(df) == 2
+        assert loader._is_cache_valid(cache_path)
+
+
+    @pytest.mark.parametrize("stale", [True, False], ids=["stale", "fresh"])
+    def test_corrupt_cache_is_refetched(self, tmp_path, monkeypatch, stale):
+        rows = [{"date": "03-01-2020", "nav": "11.0"}, {"date": "02-01-2020", "nav": "10.0"}]
+        loader, fund_name, cache_path = self._stale_loader(tmp_path, rows)
+        with open(cache_path, "r+b") as f:
+            f.truncate(16)
+        if not stale:
+            os.utime(cache_path, None)
+        self._mock_api(monkeypatch, rows)
+
+        df = loader.load_nav_data(fund_name)
+
+        assert df["nav"].tolist() == [11.0, 10.0]
+        assert len(loader._read_cache(cache_path)) == 2
+
+# ---------------------------------------------------------------------------
+# IndexCsvDataLoader
+# ---------------------------------------------------------------------------
+
+
+def _write_nse_csv(path, rows):
+    """Write an NSE-style index export with newest rows first."""
+    lines = ["Index Name,Date,Open,High,Low,Close"]
+    for date, close in rows:
+        lines.append(f"NIFTY 50,{date},-,-,-,{close}")
+    path.write_text("\n".join(lines) + "\n")
+
+
+class TestIndexCsvDataLoader:
+    ROWS = [("06-Jan-2020", "12000.5"), ("03-Jan-2020", "11950.25"), ("02-Jan-2020", "11900")]
+
+    @pytest.mark.parametrize("order", [[0, 1, 2], [2, 1, 0], [1, 0, 2]])
+    def test_loads_sorted_nav(self, tmp_path, order):
+        rows = [self.ROWS[i] for i in order]
+        _write_nse_csv(tmp_path / "NIFTY 50_Historical_PR_01012020to06012020.csv", rows)
+        loader = IndexCsvDataLoader(str(tmp_path))
+
+        df = loader.load_nav_data("NIFTY_50")
+        assert list(df.columns) == ["date", "nav"]
+        assert df["date"].is_monotonic_increasing
+        assert df["nav"].tolist() == [11900.0, 11950.25, 12000.5]
+
+    def test_reads_thousands_separated_close(self, tmp_path):
+        path = tmp_path / "NIFTY 50_Historical_PR_01012020to03012020.csv"
+        path.write_text(
+            "Date,Open,High,Low,Closing Index Value\n"
+            '03-Jan-2020,-,-,-,"12,345.60"\n'
+            '02-Jan-2020,-,-,-,"12,300.00"\n'
+        )
+        df = IndexCsvDataLoader(str(tmp_path)).load_nav_data("NIFTY_50")
+        assert df["nav"].tolist() == [12300.0, 12345.6]
+
+    @pytest.mark.parametrize("trailer", ["", "01-Jan-2020\n"], ids=["pyarrow", "pandas"])
+    def test_dash_close_rows_are_dropped(self, tmp_path, trailer):
+        path = tmp_path / "NIFTY 50_Historical_PR_01012020to03012020.csv"
+        path.write_text("Date,Open,Close\n03-Jan-2020,-,12345.6\n02-Jan-2020,-,-\n" + trailer)
+        df = IndexCsvDataLoader(str(tmp_path)).load_nav_data("NIFTY_50")
+        assert df["date"].tolist() == [pd.Timestamp("2020-01-03")]
+        assert df["nav"].tolist() == [12345.6]
+
+    @pytest.mark.parametrize("trailer", ["", "01-Jan-2020\n"], ids=["pyarrow", "pandas"])
+    def test_utf8_bom_header(self, tmp_path, trailer):
+        path = tmp_path / "NIFTY 50_Historical_PR_01012020to03012020.csv"
+        path.write_bytes(
+            b"\xef\xbb\xbfDate,Open,Close\n03-Jan-2020,-,12345.6\n02-Jan-2020,-,12300\n"
+            + trailer.encode()
+        )
+        df = IndexCsvDataLoader(str(tmp_path)).load_nav_data("NIFTY_50")
+        assert df["nav"].tolist() == [12300.0, 12345.6]
+
+    @pytest.mark.parametrize("trailer", ["", "01-Jan-2020\n"], ids=["pyarrow", "pandas"])
+    def test_duplicate_close_header_uses_first(self, tmp_path, trailer):
+        path = tmp_path / "NIFTY 50_Historical_PR_01012020to03012020.csv"
+        path.write_text("Date,Close,Close\n03-Jan-2020,12345.6,1\n02-Jan-2020,12300,2\n" + trailer)
+        df = IndexCsvDataLoader(str(tmp_path)).load_nav_data("NIFTY_50")
+        assert df["nav"].tolist() == [12300.0, 12345.6]
+
+    def test_large_files_are_streamed(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("mfsim.utils.data_loader._NSE_STREAM_THRESHOLD", 0)
+        path = tmp_path / "NIFTY 50_Historical_PR_01012020to03012020.csv"
+        path.write_text('Date,Close\n03-Jan-2020,"12,345.60"\n02-Jan-2020,12300\n')
+        df = IndexCsvDataLoader(str(tmp_path)).load_nav_data("NIFTY_50")
+        assert df["nav"].tolist() == [12300.0, 12345.6]
+
+    def test_ragged_rows_fall_back_to_pandas(self, tmp_path):
+        path = tmp_path / "NIFTY 50_Historical_PR_01012020to03012020.csv"
+        # pyarrow rejects the short last row; pandas pads it with NaN.
+        path.write_text(
+            'Date,Open,Close\n03-Jan-2020,-,"12,345.60"\n02-Jan-2020,-,12300\n01-Jan-2020\n'
+        )
+        df = IndexCsvDataLoader(str(tmp_path)).load_nav_data("NIFTY_50")
+        assert df["nav"].tolist() == [12300.0, 12345.6]
+
+    @pytest.mark.parametrize(
+        "dates",
+        [
+            ["03-JAN-2020", "02-JAN-2020"],
+            ["03 Jan 2020", "02 Jan 2020"],
+            ["03-01-2020", "02-01-2020"],
+        ],
+    )
+    def test_date_formats_are_day_first(self, tmp_path, dates):
+        _write_nse_csv(
+            tmp_path / "NIFTY 50_Historical_PR_01012020to03012020.csv",
+            [(dates[0], "11950"), (dates[1], "11900")],
+        )
+        df = IndexCsvDataLoader(str(tmp_path)).load_nav_data("NIFTY_50")
+        assert df["date"].tolist() == list(pd.to_datetime(["2020-01-02", "2020-01-03"]))
+
+    def test_mixed_date_formats_all_parse(self, tmp_path):
+        _write_nse_csv(
+            tmp_path / "NIFTY 50_Historical_PR_01012020to06012020.csv",
+            [("06-Jan-2020", "12000"), ("03 Jan 2020", "11950"), ("02-01-2020", "11900")],
+        )
+        df = IndexCsvDataLoader(str(tmp_path)).load_nav_data("NIFTY_50")
+        assert df["date"].tolist() == list(
+            pd.to_datetime(["2020-01-02", "2020-01-03", "2020-01-06"])
+        )
+        assert df["nav"].tolist() == [11900.0, 11950.0, 12000.0]
+
+    def test_unparseable_dates_are_dropped(self, tmp_path, caplog):
+        _write_nse_csv(
+            tmp_path / "NIFTY 50_Historical_PR_01012020to06012020.csv",
+            [("06-Jan-2020", "12000"), ("not a date", "11950"), ("02-Jan-2020", "11900")],
+        )
+        with caplog.at_level("WARNING", logger="mfsim.utils.data_loader"):
+            df = IndexCsvDataLoader(str(tmp_path)).load_nav_data("NIFTY_50")
+        assert df["date"].tolist() == list(pd.to_datetime(["2020-01-02", "2020-01-06"]))
+        assert df["nav"].tolist() == [11900.0, 12000.0]
+        assert "unparseable dates" in caplog.text
+
+    def test_load_does_not_leak_mutations(self, tmp_path):
+        _write_nse_csv(tmp_path / "NIFTY 50_Historical_PR_01012020to06012020.csv", self.ROWS)
+        loader = IndexCsvDataLoader(str(tmp_path))
+        df = loader.load_nav_data("NIFTY_50")
+        df["nav"] = df["nav"] * 2
+        df.set_index("date", inplace=True)
+        again = loader.load_nav_data("NIFTY_50")
+        assert list(again.columns) == ["date", "nav"]
+        assert again["nav"].tolist() == [11900.0, 11950.25, 12000.5]
+
+    def test_nav_at_snaps_forward(self, tmp_path):
+        _write_nse_csv(tmp_path / "NIFTY 50_Historical_PR_01012020to06012020.csv", self.ROWS)
+        loader = IndexCsvDataLoader(str(tmp_path))
+        assert loader.nav_at("NIFTY_50", pd.Timestamp("2020-01-03")) == 11950.25
+        assert loader.nav_at("NIFTY_50", pd.Timestamp("2020-01-04")) == 12000.5
+        assert math.isnan(loader.nav_at("NIFTY_50", pd.Timestamp("2020-01-07")))
+
+    def test_unknown_index_raises(self, tmp_path):
+        _write_nse_csv(tmp_path / "NIFTY 50_Historical_PR_01012020to06012020.csv", self.ROWS)
+        loader = IndexCsvDataLoader(str(tmp_path))
+        with pytest.raises(ValueError):
+            loader.load_nav_data("NIFTY_NEXT_50")
+
+    def test_sidecar_cache_reused_until_csv_changes(self, tmp_path, monkeypatch):
+        csv_path = tmp_path / "NIFTY 50_Historical_PR_01012020to06012020.csv"
+        _write_nse_csv(csv_path, self.ROWS)
+        first = IndexCsvDataLoader(str(tmp_path)).load_nav_data("NIFTY_50")
+        assert os.path.exists(str(csv_path) + ".arrow")
+
+        def fail(self, path):
+            raise AssertionError("CSV should not be re-parsed")
+
+        monkeypatch.setattr(IndexCsvDataLoader, "_parse_csv", fail)
+        cached = IndexCsvDataLoader(str(tmp_path)).load_nav_data("NIFTY_50")
+        pd.testing.assert_frame_equal(cached, first)
+
+        monkeypatch.undo()
+        _write_nse_csv(csv_path, [("07-Jan-2020", "12100"), *self.ROWS])
+        os.utime(csv_path, (time.time() + 10, time.time() + 10))
+        refreshed = IndexCsvDataLoader(str(tmp_path)).load_nav_data("NIFTY_50")
+        assert len(refreshed) == 4
+
+    def test_sidecar_from_other_parser_version_is_reparsed(self, tmp_path):
+        csv_path = tmp_path / "NIFTY 50_Historical_PR_01012020to06012020.csv"
+        _write_nse_csv(csv_path, self.ROWS)
+        stale = pd.DataFrame({"date": pd.to_datetime(["2020-01-06"]), "nav": [1.0]})
+        data_loader._write_arrow(str(csv_path) + ".arrow", stale)
+        os.utime(str(csv_path) + ".arrow", (time.time() + 10, time.time() + 10))
+
+        df = IndexCsvDataLoader(str(tmp_path)).load_nav_data("NIFTY_50")
+
+        assert df["nav"].tolist() == [11900.0, 11950.25, 12000.5]
+        restamped = data_loader._read_arrow(
+            str(csv_path) + ".arrow", metadata=data_loader._NSE_SIDECAR_METADATA
+        )
+        assert restamped is not None
+
+    def test_loads_every_index_in_directory(self, tmp_path):
+        names = ["NIFTY 50", "NIFTY ALPHA 50", "NIFTY200 MOMENTUM 30"]
+        for name in names:
+            _write_nse_csv(tmp_path / f"{name}_Historical_PR_01012020to06012020.csv", self.ROWS)
+        (tmp_path / "notes.txt").write_text("not an index")
+
+        loader = IndexCsvDataLoader(str(tmp_path))
+        assert sorted(loader.index_data) == ["NIFTY200_MOMENTUM_30", "NIFTY_50", "NIFTY_ALPHA_50"]
+        for key in loader.index_data:
+            assert len(loader.load_nav_data(key)) == 3
+
+    def test_duplicate_exports_pick_last_file_name(self, tmp_path):
+        _write_nse_csv(
+            tmp_path / "NIFTY 50_Historical_PR_01012019to31122019.csv", [("02-Jan-2019", "10000")]
+        )
+        _write_nse_csv(tmp_path / "NIFTY 50_Historical_PR_01012020to06012020.csv", self.ROWS)
+        (tmp_path / "NIFTY 50_Historical_PR_zz.csv").mkdir()  # directories are skipped
+
+        df = IndexCsvDataLoader(str(tmp_path)).load_nav_data("NIFTY_50")
+        assert df["nav"].tolist() == [11900.0, 11950.25, 12000.5]
@@ -0,0 +1,75 @@
+"""Tests for parallel parameter-grid sweeps.
+
+Uses the ``MockDataLoader`` and ``BuyAndHoldStrategy`` from ``tests/_data.py``.
+"""
+
+import pytest
+
+from mfsim.backtester import grid
+from mfsim.backtester.grid import run_grid
+from mfsim.backtester.simulator import Simulator
+from tests._data import BuyAndHoldStrategy
+
+SIMULATOR_KWARGS = {
+    "start_date": "2020-01-02",
+    "end_date": "2020-06-30",
+    "initial_investment": 100000,
+    "sip_amount": 0,
+}
+
+GRID = {"allocation": [{"Fund A": 1.0}, {"Fund A": 0.5, "Fund B": 0.5}, {"Fund B": 1.0}]}
+
+
+class TestRunGrid:
+    def test_one_row_per_combination(self, mock_loader):
+        results = run_grid(
+            BuyAndHoldStrategy,
+            GRID,
+            SIMULATOR_KWARGS,
+            strategy_kwargs={"fund_list": ["Fund A", "Fund B"]},
+            data_loader=mock_loader,
+            max_workers=1,
+        )
+        assert len(results) == 3
+        assert {"allocation", "TotalReturn", "XIRR"} <= set(results.columns)
+        # Fund A grows faster than Fund B in the fixture data.
+        returns = results["TotalReturn"].tolist()
+        assert returns[0] > returns[1] > returns[2]
+
+    def test_in_process_run_releases_worker_state(self, mock_loader):
+        run_grid(
+            BuyAndHoldStrategy,
+            GRID,
+            SIMULATOR_KWARGS,
+            strategy_kwargs={"fund_list": ["Fund A", "Fund B"]},
+            data_loader=mock_loader,
+            max_workers=1,
+        )
+        assert grid._worker_state == {}
+
+    def test_matches_direct_simulation(self, mock_loader):
+        """Each grid row should equal a standalone Simulator run, in grid order."""
+        results = run_grid(
+            BuyAndHoldStrategy,
+            GRID,
+            SIMULATOR_KWARGS,
+            strategy_kwargs={"fund_list": ["Fund A", "Fund B"]},
+            data_loader=mock_loader,
+            max_workers=2,
+        )
+        for row, allocation in zip(results.itertuples(), GRID["allocation"]):
+            strategy = BuyAndHoldStrategy(["Fund A", "Fund B"], allocation=allocation)
+            expected = Simulator(
+                strategy=strategy, data_loader=mock_loader, **SIMULATOR_KWARGS
+            ).run()
+            assert row.TotalReturn == pytest.approx(expected["TotalReturn"], rel=1e-12)
+
+    def test_empty_grid(self, mock_loader):
+        results = run_grid(
+            BuyAndHoldStrategy,
+            {"allocation": []},
+            SIMULATOR_KWARGS,
+            strategy_kwargs={"fund_list": ["Fund A", "Fund B"]},
+            data_loader=mock_loader,
+        )
+        assert results.empty
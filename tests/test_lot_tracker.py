@@ -6,9 +6,10 @@ and edge cases (sell with loss, sell empty fund, partial lots).
 
 from datetime import datetime
 
+import numpy as np
 import pytest
 
-from mfsim.backtester.lot_tracker import LotTracker, RealizedGain
+from mfsim.backtester.lot_tracker import Lot, LotTracker, RealizedGain
 
 # ---------------------------------------------------------------------------
 # Buy operations
@@ -47,6 +48,39 @@ class TestLotTrackerBuy:
         assert lot.cost_per_unit == 20.0
         assert lot.lot_id  # non-empty id
 
+    def test_lot_constructor_takes_floats(self):
+        positional = Lot("Fund A", datetime(2023, 1, 1), 10.0, 5.0, "abc")
+        keyword = Lot(
+            fund_name="Fund A",
+            purchase_date=datetime(2023, 1, 1),
+            units=10.0,
+            cost_per_unit=5.0,
+            lot_id="abc",
+        )
+        assert positional == keyword
+        assert (positional.units, positional.cost_per_unit) == (10.0, 5.0)
+        assert "units=10.0" in repr(positional)
+
+    def test_lot_units_are_assignable(self):
+        lot = Lot("Fund A", datetime(2023, 1, 1), 10.0, 5.0)
+        lot.units = 4.5
+        assert lot.units == 4.5
+
+    def test_lots_share_one_fund_name_object(self):
+        tracker = LotTracker()
+        first = tracker.buy("".join(["Fund ", "A"]), datetime(2023, 1, 1), 10.0, 10.0)
+        second = tracker.buy("".join(["Fund ", "A"]), datetime(2023, 2, 1), 10.0, 10.0)
+        gains = tracker.sell("Fund A", datetime(2023, 3, 1), 20.0, 11.0)
+        assert first.fund_name is second.fund_name
+        assert all(g.fund_name is first.fund_name for g in gains)
+
+    def test_buy_accepts_str_subclass_fund_name(self):
+        tracker = LotTracker()
+        name = np.array(["Fund A"])[0]
+        lot = tracker.buy(name, datetime(2023, 1, 1), 10.0, 10.0)
+        assert type(lot.fund_name) is str
+        assert tracker.get_holdings("Fund A") == 10.0
+
     def test_buy_zero_units(self):
         tracker = LotTracker()
         lot = tracker.buy("Fund A", datetime(2023, 1, 1), 0.0, 10.0)
@@ -69,7 +103,7 @@ class TestLotTrackerSell:
         assert gains[0].units == 100.0
         assert gains[0].gain == pytest.approx(500.0, abs=1e-8)  # (15 - 10) * 100
         assert gains[0].holding_days == 365
-        assert tracker.get_holdings("Fund A") == pytest.approx(0.0, abs=1e-10)
+        assert tracker.get_holdings("Fund A") == 0.0
 
     def test_partial_lot_sell(self):
         tracker = LotTracker()
@@ -101,6 +135,18 @@ class TestLotTrackerSell:
         gains = tracker.sell("Fund A", datetime(2023, 6, 1), 100.0, 8.0)
         assert gains[0].gain == pytest.approx(-200.0, abs=1e-8)  # (8 - 10) * 100
 
+    @pytest.mark.parametrize("sell_units, expected_lots", [(55.0, 6), (50.0, 5), (500.0, 10)])
+    def test_sell_across_many_lots(self, sell_units, expected_lots):
+        tracker = LotTracker()
+        for month in range(1, 11):
+            tracker.buy("Fund A", datetime(2023, month, 1), 10.0, float(month))
+        gains = tracker.sell("Fund A", datetime(2024, 1, 1), sell_units, 20.0)
+
+        assert len(gains) == expected_lots
+        assert [g.cost_per_unit for g in gains] == [float(m) for m in range(1, expected_lots + 1)]
+        assert sum(g.units for g in gains) == min(sell_units, 100.0)
+        assert tracker.get_holdings("Fund A") == max(100.0 - sell_units, 0.0)
+
     def test_sell_empty_fund_raises(self):
         tracker = LotTracker()
         with pytest.raises(ValueError, match="No lots available"):
@@ -171,5 +217,15 @@ class TestLotTrackerHoldings:
         tracker = LotTracker()
         tracker.buy("Fund A", datetime(2023, 1, 1), 100.0, 10.0)
         tracker.sell("Fund A", datetime(2023, 6, 1), 100.0, 12.0)
-        assert tracker.get_holdings("Fund A") == pytest.approx(0.0, abs=1e-10)
+        assert tracker.get_holdings("Fund A") == 0.0
+        assert tracker.get_lots("Fund A") == []
+
+    def test_fractional_sells_leave_no_residue(self):
+        tracker = LotTracker()
+        for month in range(1, 4):
+            tracker.buy("Fund A", datetime(2023, month, 1), 0.1, 10.0)
+        # 0.1 + 0.1 + 0.1 != 0.3 in floating point; lot units are fixed-point.
+        tracker.sell("Fund A", datetime(2023, 6, 1), 0.2, 12.0)
+        tracker.sell("Fund A", datetime(2023, 7, 1), 0.1, 12.0)
+        assert tracker.get_holdings("Fund A") == 0.0
         assert tracker.get_lots("Fund A") == []
@@ -5,35 +5,55 @@ minimal, controlled scenarios (known NAVs, known cash flows).
 """
 
 import math
+from operator import itemgetter
 
 import numpy as np
 import pandas as pd
 import pytest
 
+from mfsim.metrics._numba_kernels import (
+    _max_drawdown_numpy,
+    _xirr_newton_numpy,
+    max_drawdown,
+    xirr_newton,
+)
 from mfsim.metrics.metrics_collection import (
     MaximumDrawdownMetric,
     SharpeRatioMetric,
     SortinoRatioMetric,
     TotalReturnMetric,
     XIRRMetric,
+    _nav_on_date,
     compute_portfolio_value_history,
 )
+from tests._data import METRIC_DATES
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
+# Shared one-year-horizon end date, parsed once.
+_T20210101 = pd.Timestamp("2021-01-01")
+
+_RECORD_FIELDS = itemgetter("date", "fund_name", "units", "amount")
+
+
 def _make_portfolio_history(records):
     """Build a portfolio_history DataFrame from a list of dicts.
 
     Each dict must have ``date`` (str YYYY-MM-DD), ``fund_name``, ``units``,
     ``amount``.  Returns a DataFrame indexed by ``date``.
     """
-    df = pd.DataFrame(records)
-    df["date"] = pd.to_datetime(df["date"])
-    df = df.set_index("date")
-    return df
+    dates, funds, units, amounts = zip(*map(_RECORD_FIELDS, records))
+    return pd.DataFrame(
+        {
+            "fund_name": list(funds),
+            "units": np.asarray(units, dtype=float),
+            "amount": np.asarray(amounts, dtype=float),
+        },
+        index=pd.to_datetime(list(dates), format="%Y-%m-%d", cache=True).rename("date"),
+    )
 
 
 def _make_nav_data(fund_name, dates, navs):
@@ -42,7 +62,7 @@ def _make_nav_data(fund_name, dates, navs):
     Returns ``{fund_name: DataFrame}`` with DatetimeIndex named ``date``
     and a ``nav`` column.
     """
-    idx = pd.to_datetime(dates)
+    idx = pd.to_datetime(dates, format="%Y-%m-%d", cache=True)
     nav_df = pd.DataFrame({"nav": navs}, index=idx)
     nav_df.index.name = "date"
     return {fund_name: nav_df}
@@ -61,7 +81,7 @@ class TestTotalReturn:
             [{"date": "2020-01-01", "fund_name": "Fund A", "units": 10.0, "amount": 100.0}]
         )
         current_portfolio = {"Fund A": 10.0}
-        end_date = pd.Timestamp("2021-01-01")
+        end_date = _T20210101
         nav_data = _make_nav_data("Fund A", ["2020-01-01", "2021-01-01"], [10.0, 15.0])
 
         result = metric.calculate(ph, current_portfolio, end_date, nav_data)
@@ -74,7 +94,7 @@ class TestTotalReturn:
             [{"date": "2020-01-01", "fund_name": "Fund A", "units": 10.0, "amount": 100.0}]
         )
         current_portfolio = {"Fund A": 10.0}
-        end_date = pd.Timestamp("2021-01-01")
+        end_date = _T20210101
         nav_data = _make_nav_data("Fund A", ["2020-01-01", "2021-01-01"], [10.0, 8.0])
 
         result = metric.calculate(ph, current_portfolio, end_date, nav_data)
@@ -87,7 +107,7 @@ class TestTotalReturn:
             [{"date": "2020-01-01", "fund_name": "Fund A", "units": 10.0, "amount": 100.0}]
         )
         current_portfolio = {"Fund A": 10.0}
-        end_date = pd.Timestamp("2021-01-01")
+        end_date = _T20210101
         nav_data = _make_nav_data("Fund A", ["2020-01-01", "2021-01-01"], [10.0, 10.0])
 
         result = metric.calculate(ph, current_portfolio, end_date, nav_data)
@@ -103,7 +123,7 @@ class TestTotalReturn:
             ]
         )
         current_portfolio = {"Fund A": 10.0, "Fund B": 20.0}
-        end_date = pd.Timestamp("2021-01-01")
+        end_date = _T20210101
         nav_a = _make_nav_data("Fund A", ["2020-01-01", "2021-01-01"], [10.0, 15.0])
         nav_b = _make_nav_data("Fund B", ["2020-01-01", "2021-01-01"], [10.0, 12.0])
         nav_data = {**nav_a, **nav_b}
@@ -128,7 +148,7 @@ class TestXIRR:
             [{"date": "2020-01-01", "fund_name": "Fund A", "units": 100.0, "amount": 1000.0}]
         )
         current_portfolio = {"Fund A": 100.0}
-        end_date = pd.Timestamp("2021-01-01")
+        end_date = _T20210101
         nav_data = _make_nav_data("Fund A", ["2020-01-01", "2021-01-01"], [10.0, 20.0])
 
         result = metric.calculate(ph, current_portfolio, end_date, nav_data)
@@ -141,12 +161,52 @@ class TestXIRR:
             [{"date": "2020-01-01", "fund_name": "Fund A", "units": 100.0, "amount": 1000.0}]
         )
         current_portfolio = {"Fund A": 100.0}
-        end_date = pd.Timestamp("2021-01-01")
+        end_date = _T20210101
         nav_data = _make_nav_data("Fund A", ["2020-01-01", "2021-01-01"], [10.0, 10.0])
 
         result = metric.calculate(ph, current_portfolio, end_date, nav_data)
         assert result == pytest.approx(0.0, abs=0.05)
 
+    def test_two_flows_match_closed_form(self):
+        """One investment and one terminal value solve exactly, without iteration."""
+        metric = XIRRMetric()
+        ph = _make_portfolio_history(
+            [{"date": "2020-01-01", "fund_name": "Fund A", "units": 100.0, "amount": 1000.0}]
+        )
+        end_date = pd.Timestamp("2020-07-01")
+        nav_data = _make_nav_data("Fund A", ["2020-01-01", "2020-07-01"], [10.0, 11.0])
+
+        result = metric.calculate(ph, {"Fund A": 100.0}, end_date, nav_data)
+        assert result == pytest.approx(1.1 ** (365 / 182) - 1, rel=1e-12)
+
+    def test_two_flows_overflowing_rate_is_nan(self):
+        """A 10x gain in one day has no representable annual rate."""
+        metric = XIRRMetric()
+        ph = _make_portfolio_history(
+            [{"date": "2020-01-01", "fund_name": "Fund A", "units": 100.0, "amount": 1000.0}]
+        )
+        end_date = pd.Timestamp("2020-01-02")
+        nav_data = _make_nav_data("Fund A", ["2020-01-01", "2020-01-02"], [10.0, 100.0])
+
+        assert math.isnan(metric.calculate(ph, {"Fund A": 100.0}, end_date, nav_data))
+
+    @pytest.mark.parametrize("solver", [xirr_newton, _xirr_newton_numpy])
+    def test_newton_solver_zeroes_npv(self, solver):
+        """Monthly SIP flows: the solved rate should make the NPV vanish."""
+        amounts = np.append(np.full(12, -1000.0), 13000.0)
+        day_offsets = np.append(30.0 * np.arange(12), 365.0)
+
+        rate = solver(amounts, day_offsets, 0.1, 1.48e-8, 50)
+        npv = np.sum(amounts / (1 + rate) ** (day_offsets / 365.0))
+        assert rate > 0
+        assert npv == pytest.approx(0.0, abs=1e-6)
+
+    @pytest.mark.parametrize("solver", [xirr_newton, _xirr_newton_numpy])
+    def test_newton_solver_without_root_returns_nan(self, solver):
+        amounts = np.array([-1000.0, -1000.0, -500.0])
+        day_offsets = np.array([0.0, 30.0, 60.0])
+        assert math.isnan(solver(amounts, day_offsets, 0.1, 1.48e-8, 50))
+
     def test_sip_xirr(self):
         """Two investments at different NAVs should produce a reasonable XIRR."""
         metric = XIRRMetric()
@@ -167,7 +227,7 @@ class TestXIRR:
             ]
         )
         current_portfolio = {"Fund A": 183.33}
-        end_date = pd.Timestamp("2021-01-01")
+        end_date = _T20210101
         nav_data = _make_nav_data(
             "Fund A",
             ["2020-01-01", "2020-07-01", "2021-01-01"],
@@ -181,6 +241,31 @@ class TestXIRR:
         assert not math.isnan(result)
 
 
+# ---------------------------------------------------------------------------
+# _nav_on_date
+# ---------------------------------------------------------------------------
+
+
+class TestNavOnDate:
+    DATES = ["2020-01-01", "2020-01-02", "2020-01-06"]
+
+    @pytest.mark.parametrize("layout", ["sorted_index", "unsorted_index", "date_column"])
+    def test_exact_date_lookup(self, layout):
+        nav_df = _make_nav_data("Fund A", self.DATES, [10.0, 11.0, 12.0])["Fund A"]
+        if layout == "unsorted_index":
+            nav_df = nav_df.iloc[::-1]
+        elif layout == "date_column":
+            nav_df = nav_df.reset_index()
+
+        assert _nav_on_date(nav_df, pd.Timestamp("2020-01-02")) == 11.0
+        assert math.isnan(_nav_on_date(nav_df, pd.Timestamp("2020-01-03")))  # no row, no snapping
+        assert math.isnan(_nav_on_date(nav_df, pd.Timestamp("2020-02-01")))
+
+    def test_missing_date_axis_raises(self):
+        with pytest.raises(ValueError, match="Invalid NAV data format"):
+            _nav_on_date(pd.DataFrame({"nav": [1.0]}), pd.Timestamp("2020-01-01"))
+
+
 # ---------------------------------------------------------------------------
 # compute_portfolio_value_history
 # ---------------------------------------------------------------------------
@@ -188,9 +273,8 @@ class TestXIRR:
 
 class TestComputePortfolioValueHistory:
     def test_returns_series_with_correct_length(self):
-        dates = pd.bdate_range("2020-01-01", periods=10)
+        dates = METRIC_DATES[:10]
         nav_df = pd.DataFrame({"nav": range(10)}, index=dates)
-        nav_df.index.name = "date"
 
         ph = _make_portfolio_history(
             [
@@ -210,10 +294,9 @@ class TestComputePortfolioValueHistory:
 
     def test_values_reflect_holdings_times_nav(self):
         """Portfolio value on trading days equals units * NAV."""
-        dates = pd.bdate_range("2020-01-01", periods=5)
+        dates = METRIC_DATES[:5]
         navs = [100.0, 101.0, 102.0, 103.0, 104.0]
         nav_df = pd.DataFrame({"nav": navs}, index=dates)
-        nav_df.index.name = "date"
 
         ph = _make_portfolio_history(
             [
@@ -239,31 +322,33 @@ class TestComputePortfolioValueHistory:
 
 
 class TestMaxDrawdown:
-    def test_no_drawdown_monotonic_increase(self):
+    def test_no_drawdown_monotonic_increase(self, nav_252_geometric, single_fund_history_10000):
         """Monotonically increasing NAV should have ~0 drawdown."""
         metric = MaximumDrawdownMetric()
+        ph, current_portfolio, end_date = single_fund_history_10000
 
-        dates = pd.bdate_range("2020-01-01", periods=252)
-        navs = [100.0 * (1.0005**i) for i in range(252)]
-        nav_df = pd.DataFrame({"nav": navs}, index=dates)
-        nav_df.index.name = "date"
-
-        ph = _make_portfolio_history(
-            [
-                {
-                    "date": str(dates[0].date()),
-                    "fund_name": "Fund A",
-                    "units": 100.0,
-                    "amount": 10000.0,
-                }
-            ]
-        )
-        current_portfolio = {"Fund A": 100.0}
-        nav_data = {"Fund A": nav_df}
-
-        result = metric.calculate(ph, current_portfolio, dates[-1], nav_data)
+        result = metric.calculate(ph, current_portfolio, end_date, nav_252_geometric(1.0005))
         assert result >= -0.01  # Essentially no drawdown
 
+    @pytest.mark.parametrize(
+        "values, expected",
+        [
+            ([100.0, 120.0, 90.0, 130.0, 104.0], -0.25),  # 120 -> 90
+            ([0.0, 0.0, 50.0, 40.0], -0.2),  # leading zeros have no peak
+            ([10.0, 11.0, 12.0], 0.0),
+            ([0.0, 0.0], 0.0),
+        ],
+    )
+    def test_kernels_agree(self, values, expected):
+        values = np.array(values)
+        assert max_drawdown(values) == pytest.approx(expected)
+        assert _max_drawdown_numpy(values) == pytest.approx(expected)
+
+    def test_small_drawdown_on_large_values_is_kept(self):
+        values = pd.Series([1e9, 1e9 - 10.0, 1e9], index=METRIC_DATES[:3])
+        result = MaximumDrawdownMetric().calculate(None, {}, METRIC_DATES[2], {}, values=values)
+        assert result == pytest.approx(-1e-8, rel=1e-6)
+
 
 # ---------------------------------------------------------------------------
 # SharpeRatio
@@ -271,29 +356,14 @@ class TestMaxDrawdown:
 
 
 class TestSharpeRatio:
-    def test_positive_sharpe_for_strong_returns(self):
+    def test_positive_sharpe_for_strong_returns(
+        self, nav_252_geometric, single_fund_history_10000
+    ):
         """Portfolio with returns well above risk-free rate has positive Sharpe."""
         metric = SharpeRatioMetric(risk_free_rate=0.06, frequency="daily")
+        ph, current_portfolio, end_date = single_fund_history_10000
 
-        dates = pd.bdate_range("2020-01-01", periods=252)
-        navs = [100.0 * (1.001**i) for i in range(252)]
-        nav_df = pd.DataFrame({"nav": navs}, index=dates)
-        nav_df.index.name = "date"
-
-        ph = _make_portfolio_history(
-            [
-                {
-                    "date": str(dates[0].date()),
-                    "fund_name": "Fund A",
-                    "units": 100.0,
-                    "amount": 10000.0,
-                }
-            ]
-        )
-        current_portfolio = {"Fund A": 100.0}
-        nav_data = {"Fund A": nav_df}
-
-        result = metric.calculate(ph, current_portfolio, dates[-1], nav_data)
+        result = metric.calculate(ph, current_portfolio, end_date, nav_252_geometric(1.001))
         assert result > 0
 
 
@@ -303,37 +373,34 @@ class TestSharpeRatio:
 
 
 class TestSortinoRatio:
-    def test_sortino_with_mixed_returns(self):
+    def test_sortino_with_mixed_returns(self, nav_252_random_normal, single_fund_history_10000):
         """Sortino should return a finite value for realistic return series."""
         metric = SortinoRatioMetric(risk_free_rate=0.05, frequency="daily")
+        ph, current_portfolio, end_date = single_fund_history_10000
 
-        dates = pd.bdate_range("2020-01-01", periods=252)
-        np.random.seed(42)
-        daily_returns = np.random.normal(0.001, 0.005, 252)
-        navs = [100.0]
-        for r in daily_returns[1:]:
-            navs.append(navs[-1] * (1 + r))
-        nav_df = pd.DataFrame({"nav": navs}, index=dates)
-        nav_df.index.name = "date"
-
-        ph = _make_portfolio_history(
-            [
-                {
-                    "date": str(dates[0].date()),
-                    "fund_name": "Fund A",
-                    "units": 100.0,
-                    "amount": 10000.0,
-                }
-            ]
-        )
-        current_portfolio = {"Fund A": 100.0}
-        nav_data = {"Fund A": nav_df}
-
-        result = metric.calculate(ph, current_portfolio, dates[-1], nav_data)
+        result = metric.calculate(ph, current_portfolio, end_date, nav_252_random_normal)
         assert not math.isnan(result)
         assert isinstance(result, float)
 
 
+# ---------------------------------------------------------------------------
+# Shared value history
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "metric", [SharpeRatioMetric(), SortinoRatioMetric(), MaximumDrawdownMetric()]
+)
+def test_precomputed_values_match(metric, nav_252_random_normal, single_fund_history_10000):
+    ph, current_portfolio, end_date = single_fund_history_10000
+    values = compute_portfolio_value_history(ph, nav_252_random_normal, end_date)
+
+    assert metric.uses_value_history
+    assert metric.calculate(
+        ph, current_portfolio, end_date, nav_252_random_normal, values=values
+    ) == metric.calculate(ph, current_portfolio, end_date, nav_252_random_normal)
+
+
 # ---------------------------------------------------------------------------
 # End-to-end via Simulator
 # ---------------------------------------------------------------------------
@@ -342,34 +409,14 @@ class TestSortinoRatio:
 class TestMetricsThroughSimulator:
     """Run the simulator end-to-end and verify metrics are populated."""
 
-    def test_total_return_via_simulator(self, mock_loader, buy_hold_strategy):
-        from mfsim.backtester.simulator import Simulator
-
-        sim = Simulator(
-            start_date="2020-01-02",
-            end_date="2020-12-31",
-            initial_investment=100000,
-            strategy=buy_hold_strategy,
-            sip_amount=0,
-            data_loader=mock_loader,
-        )
-        results = sim.run()
+    def test_total_return_via_simulator(self, full_year_sim):
+        results = full_year_sim.metrics_results
         assert "TotalReturn" in results
         # NAVs have positive daily return, so total return should be positive
         assert results["TotalReturn"] > 0
 
-    def test_xirr_via_simulator(self, mock_loader, buy_hold_strategy):
-        from mfsim.backtester.simulator import Simulator
-
-        sim = Simulator(
-            start_date="2020-01-02",
-            end_date="2020-12-31",
-            initial_investment=100000,
-            strategy=buy_hold_strategy,
-            sip_amount=0,
-            data_loader=mock_loader,
-        )
-        results = sim.run()
+    def test_xirr_via_simulator(self, full_year_sim):
+        results = full_year_sim.metrics_results
         assert "XIRR" in results
         assert not math.isnan(results["XIRR"])
         assert results["XIRR"] > 0
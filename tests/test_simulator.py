@@ -2,13 +2,17 @@
 
 Covers initial investment, SIP scheduling (monthly / weekly), portfolio
 value calculation, lot tracking integration, and metric computation.
-All tests use the ``MockDataLoader`` and ``BuyAndHoldStrategy`` from conftest.
+All tests use the ``MockDataLoader`` and ``BuyAndHoldStrategy`` from ``tests/_data.py``.
 """
 
 import pandas as pd
 import pytest
 
 from mfsim.backtester.simulator import Simulator
+from mfsim.metrics.metrics_collection import compute_portfolio_value_history
+from mfsim.strategies.base_strategy import BaseStrategy
+from mfsim.strategies.custom_strategy import MomentumValueStrategy
+from tests._data import BuyAndHoldStrategy, MockDataLoader
 
 # ---------------------------------------------------------------------------
 # Basic simulation
@@ -16,92 +20,84 @@ from mfsim.backtester.simulator import Simulator
 
 
 class TestSimulatorBasic:
-    def test_initial_investment_only(self, mock_loader, buy_hold_strategy):
+    @pytest.mark.parametrize("sim_fixture", ["one_month_sim", "half_year_sim", "full_year_sim"])
+    def test_initial_investment_only(self, request, sim_fixture):
         """A lump-sum with no SIP should invest exactly the initial amount."""
-        sim = Simulator(
-            start_date="2020-01-02",
-            end_date="2020-02-01",
-            initial_investment=100000,
-            strategy=buy_hold_strategy,
-            sip_amount=0,
-            data_loader=mock_loader,
-        )
-        sim.run()
+        sim = request.getfixturevalue(sim_fixture)
         assert sim.total_invested == pytest.approx(100000, rel=1e-4)
+        assert len(sim.portfolio_history) == 2  # one purchase per fund
 
-    def test_portfolio_value_positive(self, mock_loader, buy_hold_strategy):
+    def test_portfolio_value_positive(self, full_year_sim):
         """With positive daily returns, the portfolio should grow."""
-        sim = Simulator(
-            start_date="2020-01-02",
-            end_date="2020-12-31",
-            initial_investment=100000,
-            strategy=buy_hold_strategy,
-            sip_amount=0,
-            data_loader=mock_loader,
-        )
-        sim.run()
-        value = sim.get_portfolio_value()
+        value = full_year_sim.get_portfolio_value()
         assert value > 100000
 
-    def test_portfolio_value_default_end_date(self, mock_loader, buy_hold_strategy):
+    def test_portfolio_value_default_end_date(self, half_year_sim):
         """get_portfolio_value() with no argument should use end_date."""
-        sim = Simulator(
-            start_date="2020-01-02",
-            end_date="2020-06-30",
-            initial_investment=100000,
-            strategy=buy_hold_strategy,
-            sip_amount=0,
-            data_loader=mock_loader,
-        )
-        sim.run()
-        v_default = sim.get_portfolio_value()
-        v_explicit = sim.get_portfolio_value(date=sim.end_date)
+        v_default = half_year_sim.get_portfolio_value()
+        v_explicit = half_year_sim.get_portfolio_value(date=half_year_sim.end_date)
         assert v_default == pytest.approx(v_explicit, rel=1e-8)
 
-    def test_portfolio_history_records(self, mock_loader, buy_hold_strategy):
+    def test_portfolio_history_records(self, one_month_sim):
         """Each initial purchase should be recorded in portfolio_history."""
-        sim = Simulator(
-            start_date="2020-01-02",
-            end_date="2020-02-01",
-            initial_investment=100000,
-            strategy=buy_hold_strategy,
-            sip_amount=0,
-            data_loader=mock_loader,
-        )
-        sim.run()
-        history = sim.get_portfolio_history()
+        history = one_month_sim.get_portfolio_history()
         assert len(history) == 2  # one entry per fund
         fund_names = {h["fund_name"] for h in history}
         assert fund_names == {"Fund A", "Fund B"}
 
-    def test_metrics_calculated(self, mock_loader, buy_hold_strategy):
+    def test_metrics_calculated(self, full_year_sim):
         """run() should return computed metrics matching the strategy."""
+        results = full_year_sim.metrics_results
+        assert "TotalReturn" in results
+        assert "XIRR" in results
+
+    def test_portfolio_history_df_reused_until_new_transaction(
+        self, mock_loader, buy_hold_strategy
+    ):
+        """The transaction frame is cached and rebuilt only after a purchase."""
         sim = Simulator(
             start_date="2020-01-02",
-            end_date="2020-12-31",
+            end_date="2020-02-01",
             initial_investment=100000,
             strategy=buy_hold_strategy,
             sip_amount=0,
             data_loader=mock_loader,
         )
-        results = sim.run()
-        assert "TotalReturn" in results
-        assert "XIRR" in results
+        sim.run()
+        df = sim.portfolio_history_df
+        assert sim.portfolio_history_df is df
 
-    def test_total_invested_with_sip(self, mock_loader, buy_hold_strategy):
-        """total_invested should include initial + all SIP contributions."""
+        sim.make_purchase("Fund A", sim.end_date - pd.Timedelta(days=1), 1000)
+        assert len(sim.portfolio_history_df) == len(df) + 1
+
+    def test_value_history_built_once_for_all_metrics(self, mock_loader, monkeypatch):
+        """Value-history metrics share one reconstruction of the daily values."""
+        calls = []
+        monkeypatch.setattr(
+            "mfsim.backtester.simulator.compute_portfolio_value_history",
+            lambda *args: calls.append(args) or compute_portfolio_value_history(*args),
+        )
+        strategy = BuyAndHoldStrategy(
+            fund_list=["Fund A", "Fund B"],
+            allocation={"Fund A": 0.6, "Fund B": 0.4},
+            metrics=["Sharpe Ratio", "Maximum Drawdown", "Sortino Ratio"],
+        )
         sim = Simulator(
             start_date="2020-01-02",
             end_date="2020-06-30",
             initial_investment=100000,
-            strategy=buy_hold_strategy,
-            sip_amount=10000,
-            sip_frequency="monthly",
+            strategy=strategy,
+            sip_amount=0,
             data_loader=mock_loader,
         )
-        sim.run()
+        results = sim.run()
+        assert len(calls) == 1
+        assert set(results) == {"SharpeRatio", "MaximumDrawdown", "SortinoRatio"}
+
+    def test_total_invested_with_sip(self, half_year_sip_sim):
+        """total_invested should include initial + all SIP contributions."""
         # initial + at least 5 monthly SIPs (Jan through May; Jun may or may not trigger)
-        assert sim.total_invested >= 100000 + 50000
+        assert half_year_sip_sim.total_invested >= 100000 + 50000
 
 
 # ---------------------------------------------------------------------------
@@ -122,10 +118,8 @@ class TestSIPScheduling:
             data_loader=mock_loader,
         )
         sim.run()
-        df = sim.portfolio_history_df
-        months_with_purchases = set(d.month for d in df.index)
         # Expect at least 5 of the 6 months
-        assert len(months_with_purchases) >= 5
+        assert sim.portfolio_history_df.index.month.nunique() >= 5
 
     def test_weekly_sip(self, mock_loader, buy_hold_strategy):
         """Weekly SIP should fire roughly 4 times in one month."""
@@ -158,19 +152,10 @@ class TestSIPScheduling:
         # Each SIP creates 2 transactions (one per fund).
         assert len(sim.portfolio_history) >= 40  # at least 20 days * 2 funds
 
-    def test_sip_zero_disables(self, mock_loader, buy_hold_strategy):
+    def test_sip_zero_disables(self, half_year_sim):
         """sip_amount=0 should not produce any SIP transactions."""
-        sim = Simulator(
-            start_date="2020-01-02",
-            end_date="2020-06-30",
-            initial_investment=100000,
-            strategy=buy_hold_strategy,
-            sip_amount=0,
-            data_loader=mock_loader,
-        )
-        sim.run()
         # Only the initial investment (2 purchases, one per fund)
-        assert len(sim.portfolio_history) == 2
+        assert len(half_year_sim.portfolio_history) == 2
 
 
 # ---------------------------------------------------------------------------
@@ -179,18 +164,9 @@ class TestSIPScheduling:
 
 
 class TestLotTrackerIntegration:
-    def test_lots_created_on_purchase(self, mock_loader, buy_hold_strategy):
+    def test_lots_created_on_purchase(self, one_month_sim):
         """Initial investment should create one lot per fund."""
-        sim = Simulator(
-            start_date="2020-01-02",
-            end_date="2020-02-01",
-            initial_investment=100000,
-            strategy=buy_hold_strategy,
-            sip_amount=0,
-            data_loader=mock_loader,
-        )
-        sim.run()
-        assert len(sim.lots) == 2  # one lot per fund
+        assert len(one_month_sim.lots) == 2  # one lot per fund
 
     def test_lots_accumulate_with_sip(self, mock_loader, buy_hold_strategy):
         """SIP should create additional lots for each investment date."""
@@ -207,22 +183,12 @@ class TestLotTrackerIntegration:
         # Initial (2 lots) + at least 2 SIP months (4 lots) = >= 6
         assert len(sim.lots) >= 6
 
-    def test_lot_tracker_matches_current_portfolio(self, mock_loader, buy_hold_strategy):
+    def test_lot_tracker_matches_current_portfolio(self, half_year_sip_sim):
         """Lot tracker holdings should agree with current_portfolio."""
-        sim = Simulator(
-            start_date="2020-01-02",
-            end_date="2020-06-30",
-            initial_investment=100000,
-            strategy=buy_hold_strategy,
-            sip_amount=10000,
-            sip_frequency="monthly",
-            data_loader=mock_loader,
-        )
-        sim.run()
-        cp = sim.current_portfolio
-        lt = sim.lot_tracker.get_all_holdings()
-        for fund in sim.fund_list:
-            assert cp[fund] == pytest.approx(lt[fund], rel=1e-8)
+        funds = half_year_sip_sim.fund_list
+        cp = half_year_sip_sim.current_portfolio
+        lt = half_year_sip_sim.lot_tracker.get_all_holdings()
+        assert [cp[f] for f in funds] == pytest.approx([lt[f] for f in funds], rel=1e-8)
 
 
 # ---------------------------------------------------------------------------
@@ -243,5 +209,100 @@ class TestStartDateSnapping:
             sip_amount=0,
             data_loader=mock_loader,
         )
+        assert sim.first_transaction_date is None
         sim.run()
         assert sim.start_date == pd.Timestamp("2020-01-06")
+        assert sim.first_transaction_date == pd.Timestamp("2020-01-06")
+
+
+# ---------------------------------------------------------------------------
+# Rebalance order formats
+# ---------------------------------------------------------------------------
+
+
+class ShiftStrategy(BaseStrategy):
+    """Moves 100 from Fund A to Fund B each month, as dicts or a DataFrame."""
+
+    def __init__(self, as_frame):
+        super().__init__("monthly", ["Total Return"], ["Fund A", "Fund B"])
+        self.as_frame = as_frame
+
+    def rebalance(self, portfolio, nav_data, current_date):
+        orders = [
+            {"fund_name": "Fund A", "amount": -100.0},
+            {"fund_name": "Fund B", "amount": 100.0},
+        ]
+        return pd.DataFrame(orders) if self.as_frame else orders
+
+
+class TestRebalanceOrders:
+    def test_dataframe_orders_match_dict_orders(self, mock_loader):
+        """A DataFrame of orders should execute exactly like the list-of-dicts form."""
+        histories = []
+        for as_frame in (False, True):
+            sim = Simulator(
+                start_date="2020-01-02",
+                end_date="2020-04-30",
+                initial_investment=100000,
+                strategy=ShiftStrategy(as_frame),
+                sip_amount=0,
+                data_loader=mock_loader,
+            )
+            sim.run()
+            histories.append(sim.get_portfolio_history())
+
+        assert len(histories[0]) > 2
+        assert histories[0] == histories[1]
+
+
+# ---------------------------------------------------------------------------
+# NAV frame preparation
+# ---------------------------------------------------------------------------
+
+
+class TestNavFramePreparation:
+    @pytest.mark.parametrize("shape", ["parsed_dates", "date_indexed", "newest_first"])
+    def test_prepared_loader_frames_match_string_dates(
+        self, buy_hold_strategy, simple_nav_data, shape
+    ):
+        """Loaders may return parsed dates, a DatetimeIndex, or newest-first rows."""
+        frames = {}
+        for fund, df in simple_nav_data.items():
+            df = df.assign(date=pd.to_datetime(df["date"], format="%d-%m-%Y"))
+            if shape == "date_indexed":
+                df = df.set_index("date")
+            elif shape == "newest_first":
+                df = df.iloc[::-1]
+            frames[fund] = df
+
+        results = []
+        for loader in (MockDataLoader(simple_nav_data), MockDataLoader(frames)):
+            sim = Simulator(
+                start_date="2020-01-02",
+                end_date="2020-06-30",
+                initial_investment=100000,
+                strategy=buy_hold_strategy,
+                sip_amount=5000,
+                data_loader=loader,
+            )
+            results.append(sim.run())
+            assert sim.nav_data["Fund A"].index.name == "date"
+            assert sim.nav_data["Fund A"].index.is_monotonic_increasing
+
+        assert results[0] == results[1]
+
+    def test_momentum_lookback_uses_position_table_for_newest_first_data(self, simple_nav_data):
+        frames = {
+            fund: df.assign(date=pd.to_datetime(df["date"], format="%d-%m-%Y")).iloc[::-1]
+            for fund, df in simple_nav_data.items()
+        }
+        strategy = MomentumValueStrategy("quarterly", [], "Fund B", "Fund A", momentum_period=30)
+        sim = Simulator(
+            start_date="2020-01-02",
+            end_date="2020-06-30",
+            initial_investment=100000,
+            strategy=strategy,
+            data_loader=MockDataLoader(frames),
+        )
+        sim.run()
+        assert strategy._start_pos_index is sim.nav_data["Fund A"].index